@@ -1,7 +1,8 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, ClassVar, cast
+from typing import TYPE_CHECKING, ClassVar
 from pathlib import Path
 import json
+import struct
 import sys
 from PyQt5.QtNetwork import QLocalServer, QLocalSocket
 
@@ -13,8 +14,6 @@ from PyQt5.QtWidgets import (
     QMessageBox,
     QSystemTrayIcon,
     QShortcut,
-    QGraphicsOpacityEffect,
-    QToolTip,
     QWidget,
     QMainWindow,
     QApplication,
@@ -22,41 +21,134 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import (
     QIcon,
     QKeySequence,
-    QHelpEvent,
-    QWheelEvent,
-    QKeyEvent,
-    QWindow,
 )
 from PyQt5.QtCore import (
     Qt,
     QTimer,
     QEvent,
     QLockFile,
+    QObject,
 )
 
 from schemas import settings, recents, history
-from gui_tools import is_multi_window_mode
-from components import DataContainer, get_resource_path, AnimationWidget
-from utils import force_foreground_window
+from gui_tools import is_multi_window_mode, set_style_sheet
+from components import DataContainer, AnimationWidget
+from com_dialog import DialogController
+from com_results import ResultsController
+from com_sql_edit import SqlEditController
+from utils import force_foreground_window, require_resource_path
 
 if TYPE_CHECKING:
     from PyQt5.QtGui import QCloseEvent
 
 INSTANCE_MESSAGE_KEY = "file"
+# launcher payload: a version byte, then per file a little-endian u32 length and
+# the utf-8 path; older launchers send json.dumps({INSTANCE_MESSAGE_KEY: path})
+INSTANCE_PROTO_VERSION = 2
+_INSTANCE_FRAME_HEADER = struct.Struct("<I")
+
+_MOUSE_BUTTON_PRESS = QEvent.MouseButtonPress
+
+# tray clicks that restore the window; older PyQt builds lack the
+# ActivationReason helper and expose the values on QSystemTrayIcon itself
+_TRAY_RESTORE_REASONS = tuple(
+    reason
+    for reason in (
+        getattr(
+            getattr(QSystemTrayIcon, "ActivationReason", QSystemTrayIcon), name, None
+        )
+        for name in ("Trigger", "DoubleClick")
+    )
+    if reason is not None
+)
+
+
+def _take_instance_frames(buffer: bytearray) -> list[str]:
+    """Pop every complete length-prefixed path off the front of `buffer`."""
+    paths: list[str] = []
+    header_size = _INSTANCE_FRAME_HEADER.size
+    offset = 0
+    while len(buffer) - offset >= header_size:
+        (length,) = _INSTANCE_FRAME_HEADER.unpack_from(buffer, offset)
+        end = offset + header_size + length
+        if len(buffer) < end:
+            break
+        path = bytes(buffer[offset + header_size : end]).decode("utf-8", "replace")
+        if path.strip():
+            paths.append(path.strip())
+        offset = end
+    del buffer[:offset]
+    return paths
+
+
+def _parse_instance_message(payload: bytes) -> str | None:
+    """Extract the file path from a legacy JSON launcher message."""
+    payload = payload.strip()
+    try:
+        message = json.loads(payload) if payload else None
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(message, dict):
+        return None
+    file_candidate = message.get(INSTANCE_MESSAGE_KEY)
+    if isinstance(file_candidate, str):
+        file_candidate = file_candidate.strip()
+        return file_candidate or None
+    return None
 
 
 class ParquetSQLApp(QMainWindow):
-    open_windows: ClassVar[list[ParquetSQLApp]] = []
+    # insertion-ordered set of open windows; the first key is the main window
+    open_windows: ClassVar[dict[ParquetSQLApp, None]] = {}
+    # resolved file path -> the first open window showing it
+    _windows_by_file: ClassVar[dict[Path, ParquetSQLApp]] = {}
+    _multi_window_mode: ClassVar[bool | None] = None
+    _logo_icon: ClassVar[QIcon | None] = None
+    # menu refreshes requested for all windows, flushed on the next event-loop tick
+    _pending_instance_refresh: ClassVar[bool] = False
+    _pending_recents_refresh: ClassVar[bool] = False
+
+    @classmethod
+    def get_logo_icon(cls) -> QIcon:
+        """Logo icon shared by every window and tray icon, decoded once."""
+        if cls._logo_icon is None:
+            cls._logo_icon = QIcon(str(require_resource_path("static/logo.jpg")))
+        return cls._logo_icon
+
+    @classmethod
+    def is_multi_window_mode(cls) -> bool:
+        """Cached multi-window flag; cleared by `invalidate_instance_mode`."""
+        if cls._multi_window_mode is None:
+            cls._multi_window_mode = is_multi_window_mode(settings)
+        return cls._multi_window_mode
+
+    @classmethod
+    def invalidate_instance_mode(cls):
+        cls._multi_window_mode = None
 
     @classmethod
     def find_window_by_file(cls, file_path: str) -> ParquetSQLApp | None:
         """Find an open window that has the specified file loaded."""
-        target_path = Path(file_path).resolve()
-        for window in cls.open_windows:
-            opened_file = window.data_container.get_file_path()
-            if opened_file and opened_file.resolve() == target_path:
-                return window
-        return None
+        return cls._windows_by_file.get(Path(file_path).resolve())
+
+    def update_file_index(self):
+        """Re-key this window in the file index after its open file changed."""
+        cls = ParquetSQLApp
+        old_path = self._indexed_file_path
+        if old_path is not None and cls._windows_by_file.get(old_path) is self:
+            del cls._windows_by_file[old_path]
+            # hand the path over to another window still showing the same file
+            for window in cls.open_windows:
+                if window is not self and window._indexed_file_path == old_path:
+                    cls._windows_by_file[old_path] = window
+                    break
+
+        new_path = None
+        if self in cls.open_windows:
+            new_path = self.data_container.get_resolved_file_path()
+        self._indexed_file_path = new_path
+        if new_path is not None:
+            cls._windows_by_file.setdefault(new_path, self)
 
     @classmethod
     def focus_window(cls, window: ParquetSQLApp, ask_reload: bool = False):
@@ -82,13 +174,34 @@ class ParquetSQLApp(QMainWindow):
 
     @classmethod
     def refresh_all_instance_actions(cls):
-        for window in list(cls.open_windows):
-            window.menu_controller.update_instance_actions()
+        cls._schedule_menu_refresh(instance_actions=True)
 
     @classmethod
     def refresh_all_recents_menus(cls):
+        cls._schedule_menu_refresh(recents=True)
+
+    @classmethod
+    def _schedule_menu_refresh(
+        cls, instance_actions: bool = False, recents: bool = False
+    ):
+        """Queue a menu refresh for every window, coalesced per event-loop tick."""
+        scheduled = cls._pending_instance_refresh or cls._pending_recents_refresh
+        cls._pending_instance_refresh |= instance_actions
+        cls._pending_recents_refresh |= recents
+        if not scheduled:
+            QTimer.singleShot(0, cls._flush_menu_refresh)
+
+    @classmethod
+    def _flush_menu_refresh(cls):
+        instance_actions = cls._pending_instance_refresh
+        recents = cls._pending_recents_refresh
+        cls._pending_instance_refresh = False
+        cls._pending_recents_refresh = False
         for window in list(cls.open_windows):
-            window.menu_controller.update_recents_menu()
+            if instance_actions:
+                window.menu_controller.update_instance_actions()
+            if recents:
+                window.menu_controller.update_recents_menu()
 
     @classmethod
     def spawn_additional_window(cls, file_to_open: str | None):
@@ -107,6 +220,7 @@ class ParquetSQLApp(QMainWindow):
     def _force_foreground_window(cls, window: ParquetSQLApp):
         if sys.platform != "win32":
             return
+        # winId() only creates the native handle once; later calls return it
         force_foreground_window(int(window.winId()))
 
     def __init__(
@@ -119,29 +233,32 @@ class ParquetSQLApp(QMainWindow):
         super().__init__()
 
         self.setWindowTitle(settings.BASE_TITLE)
-        logo_path = get_resource_path("static/logo.jpg")
-        if not logo_path.exists():
-            raise FileNotFoundError(f"Logo file not found: {logo_path}")
-        self.setWindowIcon(QIcon(str(logo_path)))
+        self.setWindowIcon(ParquetSQLApp.get_logo_icon())
 
         self._loading: AnimationWidget | None = None
         self._tray_icon: QSystemTrayIcon | None = None
         self._hinted_tray_icon: bool = False
         self._app_event_filter_installed: bool = False
+        self._torn_down = False
 
-        self._table_effect: QGraphicsOpacityEffect | None = None
         self._force_close = False
         self._single_instance_server: QLocalServer | None = None
         self._instance_lock: QLockFile | None = None
         self._launch_minimized = launch_minimized
         self._enable_tray = enable_tray
         self._is_secondary = is_secondary
+        self._indexed_file_path: Path | None = None
+        # unread launcher bytes per connection, and which ones use framing
+        self._instance_buffers: dict[QLocalSocket, bytearray] = {}
+        self._framed_instance_sockets: set[QLocalSocket] = set()
+        self._ui_ready = False
 
         self._init_ui_components()
         self.menu_controller.update_settings()
 
-        if self._enable_tray:
-            self._init_tray_icon()
+        if self._enable_tray and self._launch_minimized:
+            # starting hidden needs the tray now; otherwise it is built on close
+            self.ensure_tray_icon()
 
         self.update_window_title()
 
@@ -151,14 +268,24 @@ class ParquetSQLApp(QMainWindow):
             QTimer.singleShot(0, self.minimize_on_launch)
         else:
             self.show()
-            if sys.platform == "win32":
-                force_foreground_window(int(self.winId()))
+            ParquetSQLApp._force_foreground_window(self)
 
-        ParquetSQLApp.open_windows.append(self)
+        ParquetSQLApp.open_windows[self] = None
+        self.update_file_index()
 
         if file_path:
+            # auto-executes the saved or default query; the load runs off-thread
             self.data_container.open_file_path(file_path, add_to_recents=True)
-            self.sql_edit_controller.execute_query(add_to_history=False)
+
+    def apply_ui_font_size(self):
+        """Set the UI font size for every button and label in one style pass."""
+        central_widget = self.centralWidget()
+        if central_widget is None:
+            return
+        set_style_sheet(
+            central_widget,
+            f"QPushButton, QLabel {{ font-size: {int(settings.default_ui_font_size)}pt; }}",
+        )
 
     def update_window_title(self):
         path = self.data_container.get_file_path()
@@ -190,12 +317,7 @@ class ParquetSQLApp(QMainWindow):
         if confirm != QMessageBox.Yes:
             return
 
-        self._force_close = True
-        self.release_resources()
-        self._close_instance_server()
-        self._release_instance_lock()
-        if app := QApplication.instance():
-            app.quit()
+        self._quit_application()
 
     def ensure_tray_icon(self) -> bool:
         if self._tray_icon:
@@ -204,19 +326,7 @@ class ParquetSQLApp(QMainWindow):
         return self._tray_icon is not None
 
     def handle_tray_activation(self, reason: int):
-        activation_reason = getattr(QSystemTrayIcon, "ActivationReason", None)
-        valid_reasons = []
-        if activation_reason:
-            trigger = getattr(activation_reason, "Trigger", None)
-            double_click = getattr(activation_reason, "DoubleClick", None)
-            valid_reasons = [val for val in (trigger, double_click) if val is not None]
-        else:
-            # fallback for PyQt versions without ActivationReason helper
-            trigger = getattr(QSystemTrayIcon, "Trigger", None)
-            double_click = getattr(QSystemTrayIcon, "DoubleClick", None)
-            valid_reasons = [val for val in (trigger, double_click) if val is not None]
-
-        if not valid_reasons or reason in valid_reasons:
+        if not _TRAY_RESTORE_REASONS or reason in _TRAY_RESTORE_REASONS:
             self._restore_from_tray()
 
     def hint_tray_icon(self):
@@ -242,15 +352,29 @@ class ParquetSQLApp(QMainWindow):
             self.showMinimized()
 
     def exit_from_tray(self):
+        self._quit_application()
+
+    def _quit_application(self):
         self._force_close = True
+        # other windows may still hold a debounced history save
+        for window in ParquetSQLApp.open_windows:
+            window.sql_edit_controller.flush_history()
+        self._teardown()
+        if app := QApplication.instance():
+            app.quit()
+
+    def _teardown(self):
+        """Final release of this window's data and instance resources; runs once."""
+        if self._torn_down:
+            return
+        self._torn_down = True
         self.release_resources()
         self._close_instance_server()
         self._release_instance_lock()
-        if app := QApplication.instance():
-            app.quit()
 
     def release_resources(self):
         self.stop_loading_animation()
+        self.sql_edit_controller.flush_history()
         self.data_container.release_resources()
         self.result_controller.release_resources()
 
@@ -258,7 +382,7 @@ class ParquetSQLApp(QMainWindow):
         if (
             not self._force_close
             and not self._tray_icon
-            and self._is_last_open_window()
+            and (self._enable_tray or self._is_last_open_window())
         ):
             self.ensure_tray_icon()
 
@@ -269,15 +393,14 @@ class ParquetSQLApp(QMainWindow):
             self.minimize_to_tray()
             return
 
-        self.release_resources()
-        self._close_instance_server()
-        self._release_instance_lock()
+        self._teardown()
         super().closeEvent(event)
         if event.isAccepted() and self in ParquetSQLApp.open_windows:
-            ParquetSQLApp.open_windows.remove(self)
+            del ParquetSQLApp.open_windows[self]
+            self.update_file_index()
 
     def open_new_window_instance(self):
-        if not is_multi_window_mode(settings):
+        if not ParquetSQLApp.is_multi_window_mode():
             QMessageBox.information(
                 self,
                 "Multi-Window Disabled",
@@ -287,124 +410,46 @@ class ParquetSQLApp(QMainWindow):
         self._open_additional_window(None)
 
     def start_loading_animation(self):
-        if self._loading:
-            self._loading.stop()
-        if self._table_effect is None:
-            self._table_effect = QGraphicsOpacityEffect(
-                self.result_controller.result_table
-            )
-        self._table_effect.setOpacity(0.35)
-        self.result_controller.result_table.setGraphicsEffect(self._table_effect)
-        self.result_controller.result_table.setDisabled(True)
-        if not self.isHidden():
+        self.result_controller.result_table.set_loading(True)
+        if self.isHidden():
+            return
+        # one animation per window, restarted by its showEvent on every query
+        if self._loading is None:
             self._loading = AnimationWidget(self)
-            self._loading.show()
+        self._loading.show()
 
     def stop_loading_animation(self):
-        self.result_controller.result_table.setEnabled(True)
-        self.result_controller.result_table.setGraphicsEffect(None)
-        self._table_effect = None
-        if self._loading:
+        self.result_controller.result_table.set_loading(False)
+        if self._loading is not None:
             self._loading.stop()
-            self._loading = None
 
-    def eventFilter(self, obj: QWidget | QWindow, event: QEvent):
+    def watch_outside_clicks(self, enabled: bool):
+        """Filter application-wide mouse presses only while a popup is open."""
+        app = QApplication.instance()
+        if app is None or enabled == self._app_event_filter_installed:
+            return
+        if enabled:
+            app.installEventFilter(self)
+        else:
+            app.removeEventFilter(self)
+        self._app_event_filter_installed = enabled
 
-        if event.type() == QEvent.MouseButtonPress and isinstance(obj, QWidget):
+    def eventFilter(self, obj: QObject, event: QEvent):
+        # installed on the QApplication while a popup is open, so this sees every
+        # event in the process; QObject's base filter only returns False
+        if event.type() == _MOUSE_BUTTON_PRESS and isinstance(obj, QWidget):
             self.dialog_controller.auto_close_dialog(obj)
-
-        if obj in (
-            self.result_controller.result_table,
-            self.result_controller.result_table.viewport(),
-        ):
-            if isinstance(event, QWheelEvent) and event.modifiers() & Qt.ShiftModifier:  # type: ignore
-                scroll_bar = self.result_controller.result_table.horizontalScrollBar()
-                delta_point = event.pixelDelta()
-                if not delta_point.isNull():
-                    scroll_delta = delta_point.x() or delta_point.y()
-                    if scroll_delta:
-                        scroll_bar.setValue(scroll_bar.value() - scroll_delta)
-                        return True
-
-                angle_delta = event.angleDelta()
-                scroll_delta = angle_delta.x() or angle_delta.y()
-                if scroll_delta:
-                    single_step = max(1, scroll_bar.singleStep())
-                    steps = scroll_delta / 120
-                    scroll_bar.setValue(int(scroll_bar.value() - steps * single_step))
-                    return True
-
-            if event.type() == QEvent.ToolTip:
-                help_event = cast(QHelpEvent, event)
-                viewport = self.result_controller.result_table.viewport()
-                viewport_pos = viewport.mapFromGlobal(help_event.globalPos())
-                index = self.result_controller.result_table.indexAt(viewport_pos)
-                if index.isValid():
-                    item = self.result_controller.result_table.item(
-                        index.row(), index.column()
-                    )
-                    if item is not None:
-                        QToolTip.showText(
-                            help_event.globalPos(),
-                            item.text(),
-                            self.result_controller.result_table,
-                        )
-                        return True
-                QToolTip.hideText()
-                event.ignore()
-                return True
-        elif obj is self.sql_edit_controller.sql_edit and isinstance(event, QKeyEvent):
-            if event.type() != QEvent.KeyPress:
-                return False
-            key = event.key()
-            modifiers = event.modifiers()
-
-            if self.sql_edit_controller.is_completion_visible():
-                has_selection = self.sql_edit_controller.has_completion_selection()
-                if (
-                    key in (Qt.Key_Return, Qt.Key_Enter)
-                    and not (modifiers & Qt.ShiftModifier)
-                    and not has_selection
-                ):  # type: ignore
-                    self.sql_edit_controller.hide_completion_popup()
-                    self.sql_edit_controller.execute_query()
-                    return True
-                self.sql_edit_controller.handle_edit_check()
-                return False
-
-            ctrl_only = bool(modifiers & Qt.ControlModifier) and not (
-                modifiers & (Qt.ShiftModifier | Qt.AltModifier)
-            )  # type: ignore
-            if ctrl_only and key in (Qt.Key_Up, Qt.Key_Down):
-                if self.sql_edit_controller.handle_history_hotkeys(key):
-                    return True
-                return super().eventFilter(obj, event)
-            elif ctrl_only and key in (Qt.Key_Left, Qt.Key_Right):
-                if self.result_controller.handle_page_hotkeys(key):
-                    return True
-                return super().eventFilter(obj, event)
-
-            if key in (Qt.Key_Return, Qt.Key_Enter) and not (modifiers & Qt.ShiftModifier):  # type: ignore
-                self.sql_edit_controller.execute_query()
-                return True
-
-            self.sql_edit_controller.handle_edit_check()
-
-        return super().eventFilter(obj, event)
+        return False
 
     def _init_window_geometry(self):
-        screen = QApplication.desktop().screenGeometry()
-        window_width = int(screen.width() * 0.8)
-        window_height = int(screen.height() * 0.8)
-        x = (screen.width() - window_width) // 2
-        y = (screen.height() - window_height) // 2
+        screen = QApplication.primaryScreen().availableGeometry()
+        window_width = screen.width() * 8 // 10
+        window_height = screen.height() * 8 // 10
+        x = screen.x() + (screen.width() - window_width) // 2
+        y = screen.y() + (screen.height() - window_height) // 2
         self.setGeometry(x, y, window_width, window_height)
 
     def _init_ui_components(self):
-        from com_results import ResultsController
-        from com_sql_edit import SqlEditController
-        from com_dialog import DialogController
-
         self.data_container = DataContainer(self, settings)
         layout = QVBoxLayout()
 
@@ -455,11 +500,11 @@ class ParquetSQLApp(QMainWindow):
 
         self._create_menu_bar()
         self.result_controller.update_page_text()
+        self._ui_ready = True
 
-        app = QApplication.instance()
-        if app is not None and not self._app_event_filter_installed:
-            app.installEventFilter(self)
-            self._app_event_filter_installed = True
+    def is_ui_ready(self) -> bool:
+        """True once every controller and the menu bar have been created."""
+        return self._ui_ready
 
     def _handle_incoming_instance_request(self):
         if not self._single_instance_server:
@@ -467,43 +512,55 @@ class ParquetSQLApp(QMainWindow):
         socket = self._single_instance_server.nextPendingConnection()
         if not socket:
             return
+        self._instance_buffers[socket] = bytearray()
         socket.readyRead.connect(self._handle_instance_socket_data)
+        socket.disconnected.connect(self._handle_instance_socket_closed)
 
     def _handle_instance_socket_data(self):
+        socket = self.sender()
+        if isinstance(socket, QLocalSocket):
+            self._drain_instance_socket(socket)
+
+    def _handle_instance_socket_closed(self):
         socket = self.sender()
         if not isinstance(socket, QLocalSocket):
             return
-        data = bytes(socket.readAll()).decode("utf-8").strip()
-        socket.disconnectFromServer()
+        self._drain_instance_socket(socket)
+        buffer = self._instance_buffers.pop(socket, None)
+        is_framed = socket in self._framed_instance_sockets
+        self._framed_instance_sockets.discard(socket)
         socket.deleteLater()
-        self._handle_instance_message(data)
-
-    def _handle_instance_message(self, payload: str):
-        multi_mode = is_multi_window_mode(settings)
-        file_to_open: str | None = None
-        message = None
-        if payload:
-            try:
-                message = json.loads(payload)
-            except json.JSONDecodeError:
-                message = None
-        if isinstance(message, dict):
-            file_candidate = cast(str | None, message.get(INSTANCE_MESSAGE_KEY))
-            if isinstance(file_candidate, str):
-                file_candidate = file_candidate.strip()
-            file_to_open = file_candidate or None
-
-        if not file_to_open:
+        if buffer and not is_framed:
+            self._handle_instance_message(bytes(buffer))
+
+    def _drain_instance_socket(self, socket: QLocalSocket):
+        buffer = self._instance_buffers.get(socket)
+        if buffer is None:
             return
+        buffer += bytes(socket.readAll())
+        if socket not in self._framed_instance_sockets:
+            if not buffer or buffer[0] != INSTANCE_PROTO_VERSION:
+                # legacy json message, parsed once the launcher disconnects
+                return
+            del buffer[0]
+            self._framed_instance_sockets.add(socket)
+        for file_to_open in _take_instance_frames(buffer):
+            self._open_instance_file(file_to_open)
 
-        if multi_mode:
+    def _handle_instance_message(self, payload: bytes):
+        file_to_open = _parse_instance_message(payload)
+        if file_to_open:
+            self._open_instance_file(file_to_open)
+
+    def _open_instance_file(self, file_to_open: str):
+        if ParquetSQLApp.is_multi_window_mode():
             self._open_additional_window(file_to_open)
         else:
             self._restore_from_tray(auto_execute=False)
-            first_window = ParquetSQLApp.open_windows[0]
-            opened_file = first_window.data_container.get_file_path()
+            first_window = next(iter(ParquetSQLApp.open_windows))
+            opened_file = first_window.data_container.get_resolved_file_path()
             ask_reload = True
-            if opened_file and opened_file.resolve() != Path(file_to_open).resolve():
+            if opened_file and opened_file != Path(file_to_open).resolve():
                 ask_reload = False
                 self.data_container.open_file_path(file_to_open, add_to_recents=True)
             ParquetSQLApp.focus_window(first_window, ask_reload=ask_reload)
@@ -515,8 +572,8 @@ class ParquetSQLApp(QMainWindow):
                 ParquetSQLApp.focus_window(file_opened_window, ask_reload=True)
                 return
 
-            if len(ParquetSQLApp.open_windows) > 0:
-                first_window = ParquetSQLApp.open_windows[0]
+            if ParquetSQLApp.open_windows:
+                first_window = next(iter(ParquetSQLApp.open_windows))
                 if not first_window.data_container.is_file_open():
                     first_window.data_container.open_file_path(
                         file_to_open, add_to_recents=True
@@ -551,11 +608,21 @@ class ParquetSQLApp(QMainWindow):
         if not QSystemTrayIcon.isSystemTrayAvailable():
             return
 
-        logo_path = get_resource_path("static/logo.jpg")
-        if not logo_path.exists():
-            raise FileNotFoundError(f"Logo file not found: {logo_path}")
-        tray_icon = QSystemTrayIcon(QIcon(str(logo_path)), self)
+        tray_icon = QSystemTrayIcon(ParquetSQLApp.get_logo_icon(), self)
         tray_menu = QMenu(self)
+        # actions are created the first time the menu is opened
+        tray_menu.aboutToShow.connect(self._populate_tray_menu)
+
+        tray_icon.setContextMenu(tray_menu)
+        tray_icon.activated.connect(self.handle_tray_activation)
+        tray_icon.show()
+
+        self._tray_icon = tray_icon
+
+    def _populate_tray_menu(self):
+        tray_menu = self.sender()
+        if not isinstance(tray_menu, QMenu) or not tray_menu.isEmpty():
+            return
 
         restore_action = QAction("Restore", self)
         restore_action.triggered.connect(self._restore_from_tray)
@@ -569,12 +636,6 @@ class ParquetSQLApp(QMainWindow):
         tray_menu.addSeparator()
         tray_menu.addAction(exit_action)
 
-        tray_icon.setContextMenu(tray_menu)
-        tray_icon.activated.connect(self.handle_tray_activation)
-        tray_icon.show()
-
-        self._tray_icon = tray_icon
-
     def _restore_from_tray(self, auto_execute: bool = True):
         # Ensure proper window state
         self.setWindowState(Qt.WindowNoState)
@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING
 from PyQt5.QtWidgets import QVBoxLayout, QWidget
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QDialog
-from gui_tools import markdown_to_html_with_table_styles
+from gui_tools import markdown_to_html, markdown_to_html_with_table_styles
 from components import Popup, SearchableTextBrowser
 
 if TYPE_CHECKING:
@@ -48,13 +48,7 @@ class DialogController:
 
         self._center_dialog_relative_to_window(dialog)
 
-        def _clear_dialog_reference(*_):
-            if self._dialog is dialog:
-                self._dialog = None
-
-        dialog.destroyed.connect(_clear_dialog_reference)
-        dialog.finished.connect(_clear_dialog_reference)
-        self._dialog = dialog
+        self._track_dialog(dialog)
         dialog.show()
 
     def show_dialog(self, title: str, text: str):
@@ -69,7 +63,7 @@ class DialogController:
             int(self.settings.default_result_font_size),
         )
         text_browser.setFont(table_font)
-        text_browser.setMarkdown(text)
+        text_browser.setHtml(markdown_to_html(text, table_font))
         text_browser.setReadOnly(True)
 
         layout = QVBoxLayout()
@@ -78,15 +72,26 @@ class DialogController:
 
         self._center_dialog_relative_to_window(dialog)
 
+        self._track_dialog(dialog)
+
+        dialog.show()
+
+    def _track_dialog(self, dialog: QDialog):
+        """Make `dialog` the current popup and watch for clicks outside it."""
+
         def _clear_dialog_reference(*_):
             if self._dialog is dialog:
                 self._dialog = None
 
+        def _dialog_finished(*_):
+            if self._dialog is dialog:
+                self._dialog = None
+                self._parent.watch_outside_clicks(False)
+
         dialog.destroyed.connect(_clear_dialog_reference)
-        dialog.finished.connect(_clear_dialog_reference)
+        dialog.finished.connect(_dialog_finished)
         self._dialog = dialog
-
-        dialog.show()
+        self._parent.watch_outside_clicks(True)
 
     def _center_dialog_relative_to_window(
         self, dialog: QDialog, width_ratio: float = 0.8, height_ratio: float = 0.8
@@ -1,8 +1,7 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 from pathlib import Path
 from PyQt5.QtWidgets import QAction, QFileDialog, QMessageBox
 from PyQt5.QtGui import QFont
-from gui_tools import is_multi_window_mode
 from com_settings import SettingsController
 from main import ParquetSQLApp
 
@@ -11,6 +10,15 @@ if TYPE_CHECKING:
 
 
 class MenuController:
+    # help.md ships with the app and never changes while it runs
+    _help_text: ClassVar[str | None] = None
+    # export file suffix -> DuckDB relation writer
+    # todo: add support for xlsx(https://duckdb.org/docs/guides/file_formats/excel_export.html)
+    _export_writers: ClassVar[dict[str, str]] = {
+        ".csv": "to_csv",
+        ".parquet": "to_parquet",
+    }
+
     def __init__(
         self,
         parent: ParquetSQLApp,
@@ -20,9 +28,10 @@ class MenuController:
         self._parent = parent
         self._recents = recents
         self._settings = settings
+        # pooled recent entries, re-labelled in place; surplus ones are hidden
         self._recent_actions: list[QAction] = []
-        self._new_window_action: QAction | None = None
-        self._new_window_separator: QAction | None = None
+        self._recents_separator: QAction | None = None
+        self._clear_recents_action: QAction | None = None
         # app menu
         self._settings_controller = SettingsController(
             parent, settings, self.update_settings
@@ -42,6 +51,8 @@ class MenuController:
 
         # file menu
         self.file_menu = menubar.addMenu("File")
+        # recent entries carry their path as action data and share this slot
+        self.file_menu.triggered.connect(self._on_file_menu_triggered)
         self.browse_action = QAction("Open...", parent)
         self.file_menu.addAction(self.browse_action)
         self.browse_action.triggered.connect(self._browse_file)
@@ -88,45 +99,40 @@ class MenuController:
 
     def update_recents_menu(self):
         """Refresh the File menu to show the latest recents list."""
-        if not hasattr(self, "file_menu"):
-            return
-
-        for action in self._recent_actions:
-            self.file_menu.removeAction(action)
-            action.deleteLater()
-        self._recent_actions = []
-        if not self._recents.recents:
-            return
-
-        separator = self.file_menu.addSeparator()
-        self._recent_actions.append(separator)
-
-        for recent in self._recents.recents:
-            filename = Path(recent).name
-            name = f"{filename} @ {Path(recent).parent}"
-            recent_action = QAction(name, self._parent)
-
-            def make_handler(path: str):
-                def handler(checked: bool) -> None:
-                    self._open_recent_file(checked, path)
-
-                return handler
-
-            recent_action.triggered.connect(make_handler(recent))
-            self.file_menu.addAction(recent_action)
+        if self._clear_recents_action is None:
+            self._recents_separator = self.file_menu.addSeparator()
+            self._clear_recents_action = QAction("Clear List", self._parent)
+            self._clear_recents_action.setFont(QFont("Courier", 9, weight=QFont.Bold))
+            self._clear_recents_action.triggered.connect(self._clear_recents)
+            self.file_menu.addAction(self._clear_recents_action)
+        assert self._recents_separator is not None
+
+        recents = self._recents.recents
+        while len(self._recent_actions) < len(recents):
+            recent_action = QAction(self._parent)
+            self.file_menu.insertAction(self._clear_recents_action, recent_action)
             self._recent_actions.append(recent_action)
 
-        clear_action = QAction("Clear List", self._parent)
-        clear_action.setFont(QFont("Courier", 9, weight=QFont.Bold))
-        clear_action.triggered.connect(self._clear_recents)
-        self.file_menu.addAction(clear_action)
-        self._recent_actions.append(clear_action)
+        for recent_action, recent in zip(self._recent_actions, recents):
+            if recent_action.data() != recent:
+                recent_path = Path(recent)
+                recent_action.setText(f"{recent_path.name} @ {recent_path.parent}")
+                recent_action.setData(recent)
+            recent_action.setVisible(True)
+        for recent_action in self._recent_actions[len(recents) :]:
+            recent_action.setVisible(False)
+            recent_action.setData(None)
+
+        self._recents_separator.setVisible(bool(recents))
+        self._clear_recents_action.setVisible(bool(recents))
 
     def update_action_states(self):
         has_file = self._parent.data_container.is_file_open()
         self.view_action.setEnabled(has_file)
         self.close_file_action.setEnabled(has_file)
-        self.export_action.setEnabled(has_file)
+        self.export_action.setEnabled(
+            has_file and not self._parent.data_container.is_exporting()
+        )
         self.reset_table_size_action.setEnabled(has_file)
         self.toggle_zebra_striping_action.setEnabled(has_file)
         self.reload_action.setEnabled(has_file)
@@ -135,12 +141,10 @@ class MenuController:
             self._last_column_widths = None
 
     def update_instance_actions(self):
-        multi_mode = is_multi_window_mode(self._settings)
-        if self._new_window_action:
-            self._new_window_action.setVisible(multi_mode)
-            self._new_window_action.setEnabled(multi_mode)
-        if self._new_window_separator:
-            self._new_window_separator.setVisible(multi_mode)
+        multi_mode = ParquetSQLApp.is_multi_window_mode()
+        self.new_window_action.setVisible(multi_mode)
+        self.new_window_action.setEnabled(multi_mode)
+        self.new_window_separator.setVisible(multi_mode)
 
     def add_recent(self, path: Path):
         if self._settings.save_file_history not in (
@@ -154,15 +158,21 @@ class MenuController:
         self._recents.add_recent(str(path))
         ParquetSQLApp.refresh_all_recents_menus()
 
-    def update_settings(self):
+    def update_settings(self, reload_page: bool = True):
         self._parent.menu_controller.update_action_states()
+        self._parent.apply_ui_font_size()
         self._parent.sql_edit_controller.apply_styles()
         self._parent.result_controller.apply_styles()
 
-        if not self._parent.data_container.data:
+        data = self._parent.data_container.data
+        if reload_page and data:
+            self._parent.data_container.load_page(page=1)
             return
-
-        self._parent.data_container.load_page(page=1)
+        # no page reload to push them, so restore the column rules apply_styles
+        # dropped and pick up keyword / table name changes in the completer
+        columns = data.columns if data else []
+        self._parent.sql_edit_controller.update_highlighter_columns(columns)
+        self._parent.sql_edit_controller.update_auto_complete_words(columns)
 
     def _view_file(self):
         path = self._parent.data_container.get_file_path()
@@ -209,10 +219,13 @@ class MenuController:
         self._parent.result_controller.release_resources()
 
     def _show_help_dialog(self):
-        with open(self._settings.static_dir / "help.md", "r", encoding="utf-8") as f:
-            help_text = f.read()
+        if MenuController._help_text is None:
+            help_path = self._settings.static_dir / "help.md"
+            MenuController._help_text = help_path.read_text(encoding="utf-8")
 
-        return self._parent.dialog_controller.show_dialog("Help/Info", help_text)
+        return self._parent.dialog_controller.show_dialog(
+            "Help/Info", MenuController._help_text
+        )
 
     def _export_results(self):
         if not self._parent.data_container.data:
@@ -227,28 +240,43 @@ class MenuController:
             options=options,
         )
         if file_path:
-            if file_path.endswith(".csv"):
-                self._parent.data_container.data.reader.duckdf_query.to_csv(file_path)
-            # elif filePath.endswith('.xlsx'):
-            # # todo: add support for xlsx(https://duckdb.org/docs/guides/file_formats/excel_export.html)
-            #     self.DATA.reader.duckdf_query.to(filePath, index=False)
-
-            elif file_path.endswith(".parquet"):
-                self._parent.data_container.data.reader.duckdf_query.to_parquet(
-                    file_path
-                )
-            else:
+            writer_name = self._export_writers.get(Path(file_path).suffix.lower())
+            if writer_name is None:
                 QMessageBox.warning(
                     self._parent,
                     "Invalid File Type",
-                    "Please select a valid file type (CSV or XLSX).",
+                    "Please select a valid file type (CSV or Parquet).",
                 )
+                return
+            relation = self._parent.data_container.data.reader.duckdf_query
+            write_fn = getattr(relation, writer_name)
+            self.export_action.setEnabled(False)
+            self._parent.result_controller.result_label.setText(
+                f"Exporting to {file_path}..."
+            )
+            self._parent.data_container.start_export(
+                write_fn, file_path, self._export_finished, self._export_failed
+            )
+
+    def _export_finished(self, file_path: str):
+        self.update_action_states()
+        self._parent.result_controller.result_label.setText(f"Exported to {file_path}")
+
+    def _export_failed(self, error: str):
+        self.update_action_states()
+        self._parent.result_controller.update_result_label()
+        QMessageBox.warning(self._parent, "Export Failed", error)
 
     def _clear_recents(self):
         self._recents.recents = []
         self._recents.save_recents()
         ParquetSQLApp.refresh_all_recents_menus()
 
+    def _on_file_menu_triggered(self, action: QAction):
+        file_path = action.data()
+        if isinstance(file_path, str):
+            self._open_recent_file(action.isChecked(), file_path)
+
     def _open_recent_file(self, checked: bool, file_path: str):
         if not Path(file_path).exists():
             reply = QMessageBox.question(
@@ -263,7 +291,6 @@ class MenuController:
                 self._recents.save_recents()
                 ParquetSQLApp.refresh_all_recents_menus()
             return
-        print(file_path)
         existing_window = ParquetSQLApp.find_window_by_file(file_path)
         if existing_window:
             ParquetSQLApp.focus_window(existing_window, ask_reload=True)
@@ -1,7 +1,14 @@
 import json
+import numpy as np
 import pandas as pd
 from typing import TYPE_CHECKING, Any, cast
-from PyQt5.QtGui import QColor
+from PyQt5.QtGui import (
+    QColor,
+    QHelpEvent,
+    QPixmapCache,
+    QResizeEvent,
+    QWheelEvent,
+)
 from PyQt5.QtWidgets import (
     QAction,
     QHBoxLayout,
@@ -9,21 +16,25 @@ from PyQt5.QtWidgets import (
     QMenu,
     QPushButton,
     QSizePolicy,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QToolTip,
 )
 from PyQt5.QtCore import (
+    QByteArray,
+    QEvent,
+    QModelIndex,
     QPoint,
     QTimer,
     Qt,
 )
 from PyQt5.QtWidgets import QApplication
 from gui_tools import (
-    change_font_size,
     render_column_value_counts,
     render_row_values,
+    set_style_sheet,
 )
-from components import AutoWrapDelegate
+from components import AutoWrapDelegate, DataFrameModel, LoadingOverlay
+from schemas import HeaderState
 
 if TYPE_CHECKING:
     from main import ParquetSQLApp
@@ -32,7 +43,7 @@ if TYPE_CHECKING:
     from com_dialog import DialogController
 
 
-class ResultsTable(QTableWidget):
+class ResultsTable(QTableView):
     def __init__(
         self, settings: Settings, history: History, data_container: DataContainer
     ):
@@ -45,25 +56,47 @@ class ResultsTable(QTableWidget):
         self._total_pages = None
         self._page = 1
         self._page_df: pd.DataFrame | None = None
+        # per-column object arrays of the page, built on first row lookup
+        self._page_columns: list[np.ndarray] | None = None
         self._total_view_row_count: int | None = None
         self._total_row_count: int | None = None
         self._rows_per_page: int = 0
         self._is_applying_column_widths = False
         self._zebra_striping_enabled = False
-        self._deleyed_column_saving = QTimer()
-        self._deleyed_column_saving.setSingleShot(True)
-        self._deleyed_column_saving.timeout.connect(self._save_column_widths)
+        self._delayed_column_saving = QTimer()
+        self._delayed_column_saving.setSingleShot(True)
+        self._delayed_column_saving.timeout.connect(self._save_column_widths)
         self.last_column_widths: list[tuple[str, int]] | None = None
+        self._widths_hash = 0
         self.is_error = False
         # init ui
+        self._model = DataFrameModel(self)
+        self.setModel(self._model)
         self.setWordWrap(True)
         self._wrap_delegate = AutoWrapDelegate(self, min_wrapped_lines=2)
         self.setItemDelegate(self._wrap_delegate)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.installEventFilter(self)
-        self.viewport().installEventFilter(self)
+        header = self.horizontalHeader()
+        header.setDefaultAlignment(Qt.AlignCenter)
+        header.sectionResized.connect(self._on_column_section_resized)
         self.apply_row_colors()
+        self._loading_overlay = LoadingOverlay(self)
+
+    def set_loading(self, loading: bool):
+        """Dim and disable the table while a query is running."""
+        self.setDisabled(loading)
+        if loading:
+            self._loading_overlay.setGeometry(self.rect())
+            self._loading_overlay.raise_()
+            self._loading_overlay.show()
+        else:
+            self._loading_overlay.hide()
+
+    def resizeEvent(self, event: QResizeEvent):
+        super().resizeEvent(event)
+        if self._loading_overlay.isVisible():
+            self._loading_overlay.setGeometry(self.rect())
 
     def toggle_zebra_striping(self):
         self._zebra_striping_enabled = not self._zebra_striping_enabled
@@ -81,25 +114,28 @@ class ResultsTable(QTableWidget):
             alternate_color = base_color.lighter(115)
         else:
             alternate_color = base_color.darker(110)
+        # cached cell pixmaps were painted with the previous colours
+        QPixmapCache.clear()
         if self._zebra_striping_enabled:
             self.setAlternatingRowColors(True)
-            self.setStyleSheet(
+            set_style_sheet(
+                self,
                 (
-                    "QTableWidget {"
+                    "QTableView {"
                     f"background-color: {base_color.name()};"
                     f"alternate-background-color: {alternate_color.name()};"
                     "}"
-                    "QTableWidget::item:selected { background-color: palette(highlight); }"
-                )
+                    "QTableView::item:selected { background-color: palette(highlight); }"
+                ),
             )
         else:
             self.setAlternatingRowColors(False)
-            self.setStyleSheet(f"background-color: {base_color.name()}")
+            set_style_sheet(self, f"background-color: {base_color.name()}")
 
     def reset_table_size(self):
         if not self._data_container.is_file_open():
             return
-        if self.columnCount() == 0:
+        if self.column_count() == 0:
             return
 
         self.resizeColumnsToContents()
@@ -129,58 +165,59 @@ class ResultsTable(QTableWidget):
         return self._total_pages
 
     def set_page_df(self, df: pd.DataFrame | None):
+        # model reset, row heights and column widths all land in one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_page_df(df)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _apply_page_df(self, df: pd.DataFrame | None):
         self._page_df = df
+        self._page_columns = None
         if df is None:
             self._page = 1
-            self.clear()
-            self.setRowCount(0)
-            self.setColumnCount(0)
+            self._column_names = []
+            self._model.set_dataframe(None)
             return
 
-        self.setColumnCount(len(df.columns))
-        self.setRowCount(len(df.index))
-
-        self._column_names = [str(col) for col in df.columns]  # type: ignore
-        header_labels = [
-            f"{idx + 1}\n{name}" for idx, name in enumerate(self._column_names)
+        previous_column_names = self._column_names
+        # the model reset below drops section sizes, so keep what is on screen
+        previous_widths = [
+            self.columnWidth(idx) for idx in range(len(previous_column_names))
         ]
-        if header_labels:
-            self.setHorizontalHeaderLabels(header_labels)
-        else:
-            self.setHorizontalHeaderLabels([])
-        header = self.horizontalHeader()
-        if header:
-            header.setDefaultAlignment(Qt.AlignCenter)
-            if not self._column_resize_connected:
-                header.sectionResized.connect(self._on_column_section_resized)
-                self._column_resize_connected = True
-
-        # Fill the table with the DataFrame data
-        for i in range(len(df.index)):
-            for j in range(len(df.columns)):
-                item = QTableWidgetItem(str(df.iat[i, j]))
-                self.setItem(i, j, item)
-
-        page_rows = len(df.index)
-        start_index = self.get_page_row_offset()
-        if page_rows:
-            row_labels = [str(start_index + idx + 1) for idx in range(page_rows)]
-            self.setVerticalHeaderLabels(row_labels)
-        else:
-            self.setVerticalHeaderLabels([])
+        self._column_names = [str(col) for col in df.columns]  # type: ignore
+        self._model.set_dataframe(df, row_offset=self.get_page_row_offset())
 
         self.apply_row_height()
 
         if len(df.index) and len(df.columns):
-            self.setCurrentCell(0, 0)
+            self.setCurrentIndex(self._model.index(0, 0))
 
         self._is_applying_column_widths = True
+        if previous_widths and self._column_names == previous_column_names:
+            # same columns as the previous page: skip re-measuring every cell
+            for idx, width in enumerate(previous_widths):
+                self.setColumnWidth(idx, width)
+            self._is_applying_column_widths = False
+            return
+
         self.resizeColumnsToContents()
         self._limit_max_column_widths()
-        self._restore_column_widths()
+        # auto-sized widths are the baseline that user adjustments are diffed against
+        self.last_column_widths = None
         self._collect_current_column_widths()
+        if self._restore_column_widths():
+            self._widths_hash = hash(
+                tuple(
+                    self.columnWidth(idx) for idx in range(len(self.last_column_widths))
+                )
+            )
         self._is_applying_column_widths = False
 
+    def column_count(self) -> int:
+        return self._model.columnCount()
+
     def get_column_names(self) -> list[str]:
         return self._column_names
 
@@ -189,13 +226,28 @@ class ResultsTable(QTableWidget):
 
     def release_resources(self):
         self._page_df = None
+        self._page_columns = None
         self._column_names = []
         self._total_pages = None
         self._total_row_count = None
         self._total_view_row_count = None
-        self.clear()
-        self.setRowCount(0)
-        self.setColumnCount(0)
+        self._model.set_dataframe(None)
+
+    def get_row_dict(self, row: int) -> dict[Any, Any]:
+        """One page row as {column: value} with Python-native values."""
+        df = self._page_df
+        if df is None:
+            return {}
+        if self._page_columns is None:
+            self._page_columns = [
+                (
+                    column.to_numpy(dtype=object)
+                    if isinstance(column.dtype, np.dtype)
+                    else column.to_numpy(dtype=object, na_value=None)
+                )
+                for _, column in df.items()
+            ]
+        return dict(zip(df.columns, [values[row] for values in self._page_columns]))
 
     def update_page_row_info(self):
         total_pages, total_view_row_count, total_row_count = (
@@ -215,22 +267,49 @@ class ResultsTable(QTableWidget):
             vertical_header.setMinimumSectionSize(
                 self._settings.RESULT_TABLE_ROW_HEIGHT
             )
-            vertical_font = vertical_header.font()
-            vertical_font.setPointSize(
-                max(1, int(self._settings.default_result_font_size) - 2)
-            )
+
+    def wheelEvent(self, event: QWheelEvent):
+        if event.modifiers() & Qt.ShiftModifier:  # type: ignore
+            scroll_bar = self.horizontalScrollBar()
+            delta_point = event.pixelDelta()
+            if not delta_point.isNull():
+                scroll_delta = delta_point.x() or delta_point.y()
+                if scroll_delta:
+                    scroll_bar.setValue(scroll_bar.value() - scroll_delta)
+                    event.accept()
+                    return
+
+            angle_delta = event.angleDelta()
+            scroll_delta = angle_delta.x() or angle_delta.y()
+            if scroll_delta:
+                single_step = max(1, scroll_bar.singleStep())
+                # angleDelta is in eighths of a degree; 120 is one wheel notch.
+                # int() truncates toward zero so both directions round alike
+                scroll_bar.setValue(
+                    scroll_bar.value() - int(scroll_delta * single_step / 120)
+                )
+                event.accept()
+                return
+        super().wheelEvent(event)
+
+    def viewportEvent(self, event: QEvent) -> bool:
+        if event.type() == QEvent.ToolTip:
+            help_event = cast(QHelpEvent, event)
+            index = self.indexAt(help_event.pos())
+            if index.isValid():
+                text = index.data()
+                if text is not None:
+                    QToolTip.showText(help_event.globalPos(), text, self)
+                    return True
+            QToolTip.hideText()
+            event.ignore()
+            return True
+        return super().viewportEvent(event)
 
     def get_column_name(self, column_i: int) -> str:
+        # _column_names is rebuilt from the page frame on every set_page_df
         if 0 <= column_i < len(self._column_names):
             return self._column_names[column_i]
-
-        if self._page_df is not None and 0 <= column_i < len(self._page_df.columns):
-            return str(self._page_df.columns[column_i])
-
-        header_item = self.horizontalHeaderItem(column_i)
-        if header_item:
-            parts = header_item.text().splitlines()
-            return parts[-1].strip()
         return ""
 
     def first_page(self):
@@ -274,46 +353,66 @@ class ResultsTable(QTableWidget):
         file_path = self._data_container.get_file_path()
         if not current_widths or file_path is None:
             return
-        self._history.add_col_width(str(file_path), current_widths)
-        self._deleyed_column_saving.stop()
+        header_state = HeaderState(
+            columns=self._column_names,
+            state=bytes(self.horizontalHeader().saveState().toBase64()).decode("ascii"),
+        )
+        self._history.add_col_width(str(file_path), current_widths, header_state)
 
     def _collect_current_column_widths(self) -> dict[str, int]:
-        widths: dict[str, int] = {}
-        if not self._column_names:
-            return widths
-        column_count = min(len(self._column_names), self.columnCount())
+        """Return the columns whose width differs from the auto-sized baseline."""
+        column_names = self._column_names
+        if not column_names:
+            return {}
+        column_width = self.columnWidth
+        column_count = min(len(column_names), self.column_count())
+        widths_now = [column_width(idx) for idx in range(column_count)]
+        widths_hash = hash(tuple(widths_now))
         if self.last_column_widths is None:
-            self.last_column_widths = []
-            for idx in range(column_count):
-                width = self.columnWidth(idx)
-                self.last_column_widths.append((self._column_names[idx], width))
-
-        for idx in range(column_count):
-            last_name, last_width = self.last_column_widths[idx]
-            width = self.columnWidth(idx)
-            if (
-                width > 0
-                and last_name == self._column_names[idx]
-                and last_width != width
-            ):
-                widths[self._column_names[idx]] = width
-        return widths
+            self.last_column_widths = list(zip(column_names, widths_now))
+            self._widths_hash = widths_hash
+            return {}
+        # e.g. the timer fired but the user dragged back to the same widths
+        if widths_hash == self._widths_hash:
+            return {}
+        self._widths_hash = widths_hash
+
+        return {
+            name: width
+            for (last_name, last_width), name, width in zip(
+                self.last_column_widths, column_names, widths_now
+            )
+            if width > 0 and last_name == name and last_width != width
+        }
 
     def _limit_max_column_widths(self):
-        for idx in range(self.columnCount()):
-            width = self.columnWidth(idx)
-            if width > self._settings.MAX_COLUMN_WIDTH:
-                self.setColumnWidth(idx, self._settings.MAX_COLUMN_WIDTH)
+        max_width = self._settings.MAX_COLUMN_WIDTH
+        column_width = self.columnWidth
+        too_wide = [
+            idx for idx in range(self.column_count()) if column_width(idx) > max_width
+        ]
+        for idx in too_wide:
+            self.setColumnWidth(idx, max_width)
 
     def _restore_column_widths(self) -> bool:
         """Apply persisted column widths for the current file, if any."""
         file_path = self._data_container.get_file_path()
         if not file_path or not self._column_names:
             return False
+        header_state = self._history.get_header_state(
+            str(file_path), self._column_names
+        )
+        if header_state and self.horizontalHeader().restoreState(
+            QByteArray.fromBase64(header_state.encode("ascii"))
+        ):
+            self._limit_max_column_widths()
+            return True
+
+        # files saved before header states were stored
         saved_widths = self._history.get_col_widths(str(file_path))
         if not saved_widths:
             return False
-        column_count = min(len(self._column_names), self.columnCount())
+        column_count = min(len(self._column_names), self.column_count())
         for idx in range(column_count):
             column_name = self._column_names[idx]
             width = saved_widths.get(column_name)
@@ -329,8 +428,8 @@ class ResultsTable(QTableWidget):
         """Defer persistence when the user adjusts a column width."""
         if self._page_df is None or self._is_applying_column_widths:
             return
-        if self._deleyed_column_saving.isActive() == False:
-            self._deleyed_column_saving.start(1000)
+        # restarting the single-shot timer saves once the drag has settled
+        self._delayed_column_saving.start(1000)
 
 
 class ResultsController:
@@ -349,11 +448,25 @@ class ResultsController:
             self._handle_error,
             self._query_finished,
         )
+        # page summary of the result label, rebuilt only when the page changes
+        self._label_prefix: str | None = None
+        self._label_df: pd.DataFrame | None = None
+        # (can_go_prev, can_go_next, page text) last pushed to the pager widgets
+        self._pager_state: tuple[bool, bool, str] | None = None
+        # (family, point size) last applied to the table and header fonts
+        self._font_signature: tuple[str, int] | None = None
+        # held arrow keys move the cursor faster than the label needs to follow
+        self._selection_label_timer = QTimer()
+        self._selection_label_timer.setSingleShot(True)
+        self._selection_label_timer.timeout.connect(self._flush_selection_label)
+        self._pending_selection: tuple[int | None, int | None] = (None, None)
         # init ui
         self.result_label = QLabel()
         self.result_table = ResultsTable(settings, history, self._parent.data_container)
         self.result_table.customContextMenuRequested.connect(self._show_context_menu)
-        self.result_table.currentCellChanged.connect(self._on_current_row_changed)
+        self.result_table.selectionModel().currentChanged.connect(
+            self._on_current_row_changed
+        )
 
         self.pagination_layout = QHBoxLayout()
         self.pagination_layout.setSpacing(8)
@@ -383,57 +496,56 @@ class ResultsController:
     def execute(self):
         self._parent.data_container.load_page(page=1)
         self.update_page_text()
-        self.result_table.last_column_widths = None
 
     def apply_styles(self):
         self.result_table.apply_row_colors()
         header = self.result_table.horizontalHeader()
         if header:
-            header.setStyleSheet("QHeaderView::section { padding: 6px 4px; }")
-        change_font_size(self._settings, self.result_label)
-        change_font_size(self._settings, self.first_button)
-        change_font_size(self._settings, self.prev_button)
-        change_font_size(self._settings, self.page_label)
-        change_font_size(self._settings, self.next_button)
-        change_font_size(self._settings, self.last_button)
-        table_font = self.result_table.font()
-        table_font.setFamily(self._settings.default_result_font)
-        table_font.setPointSize(int(self._settings.default_result_font_size))
-        self.result_table.setFont(table_font)
-
-        header = self.result_table.horizontalHeader()
-        header_font = header.font()
-        header_font.setFamily(self._settings.default_result_font)
-        header_font.setPointSize(
-            max(1, int(self._settings.default_result_font_size) - 1)
-        )
-        header.setFont(header_font)
-
-        vertical_header = self.result_table.verticalHeader()
-        if vertical_header:
-            vertical_font = vertical_header.font()
-            vertical_font.setFamily(self._settings.default_result_font)
-            vertical_font.setPointSize(
-                max(1, int(self._settings.default_result_font_size) - 1)
-            )
-            vertical_header.setFont(vertical_font)
-            self.result_table.apply_row_height()
+            set_style_sheet(header, "QHeaderView::section { padding: 6px 4px; }")
+        QPixmapCache.clear()
+        font_family = self._settings.default_result_font
+        font_size = int(self._settings.default_result_font_size)
+        if (font_family, font_size) != self._font_signature:
+            # setFont re-lays out every visible cell, so only do it on a change
+            self._font_signature = (font_family, font_size)
+            table_font = self.result_table.font()
+            table_font.setFamily(font_family)
+            table_font.setPointSize(font_size)
+            self.result_table.setFont(table_font)
+
+            header_font_size = max(1, font_size - 1)
+            header_font = header.font()
+            header_font.setFamily(font_family)
+            header_font.setPointSize(header_font_size)
+            header.setFont(header_font)
+
+            vertical_header = self.result_table.verticalHeader()
+            if vertical_header:
+                vertical_font = vertical_header.font()
+                vertical_font.setFamily(font_family)
+                vertical_font.setPointSize(header_font_size)
+                vertical_header.setFont(vertical_font)
+                self.result_table.apply_row_height()
         self.update_page_text()
         self.result_table.apply_settings()
 
     def update_result_label(self, row: int | None = None, column: int | None = None):
+        self._selection_label_timer.stop()
+        self._rebuild_label_prefix()
+        self._set_selection_label(row, column)
+
+    def _rebuild_label_prefix(self):
+        """Recompute the page summary part of the result label."""
         df = self.result_table.get_page_df()
+        self._label_df = df
+        self._label_prefix = None
         if df is None:
             if not self.result_table.is_error:
                 self.result_label.setText("No data loaded")
             return
         page_rows = len(df.index)
         total_cols = len(df.columns)
-        valid_row = row if isinstance(row, int) and row >= 0 else None
-        valid_col = column if isinstance(column, int) and column >= 0 else None
         start_offset = self.result_table.get_page_row_offset()
-        row_text = f"{start_offset + valid_row + 1}" if valid_row is not None else ""
-        col_text = f"{valid_col + 1}" if valid_col is not None else ""
         if page_rows:
             visible_range = f"Range: {start_offset + 1}~{start_offset + page_rows}"
         else:
@@ -444,17 +556,10 @@ class ResultsController:
         if total_view_row_count is not None:
             total_rows_text = f"{total_row_count:,}"
             total_view_rows_text = f"{total_view_row_count:,}"
-            select_text = (
-                f"Select: {row_text}×{col_text}"
-                if (row_text + col_text).strip()
-                else ""
-            )
             row_stats_text = f"{total_view_rows_text}"
             if total_view_rows_text != total_rows_text:
                 row_stats_text += f" of {total_rows_text}"
-            self.result_label.setText(
-                f"Rows: {row_stats_text}   Page Rows: {str(page_rows)}    {visible_range}   Cols: {total_cols}   {select_text}"
-            )
+            self._label_prefix = f"Rows: {row_stats_text}   Page Rows: {str(page_rows)}    {visible_range}   Cols: {total_cols}   "
             total_pages = self.result_table.get_total_pages()
             self.last_button.setText(str(total_pages))
         else:
@@ -465,6 +570,20 @@ class ResultsController:
                 self.result_label.setText("No data loaded")
             self.last_button.setText("")
 
+    def _set_selection_label(self, row: int | None, column: int | None):
+        """Append the selection to the cached page summary."""
+        if self._label_prefix is None:
+            return
+        valid_row = row if isinstance(row, int) and row >= 0 else None
+        valid_col = column if isinstance(column, int) and column >= 0 else None
+        start_offset = self.result_table.get_page_row_offset()
+        row_text = f"{start_offset + valid_row + 1}" if valid_row is not None else ""
+        col_text = f"{valid_col + 1}" if valid_col is not None else ""
+        select_text = (
+            f"Select: {row_text}×{col_text}" if (row_text + col_text).strip() else ""
+        )
+        self.result_label.setText(self._label_prefix + select_text)
+
     def update_page_text(self):
         """set next / prev button text"""
         data = self._parent.data_container.data
@@ -480,17 +599,25 @@ class ResultsController:
             can_go_next = False
             page_str = ""
 
+        pager_state = (can_go_prev, can_go_next, page_str)
+        if pager_state == self._pager_state:
+            return
+        self._pager_state = pager_state
         self.prev_button.setEnabled(can_go_prev)
         self.first_button.setEnabled(can_go_prev)
         self.next_button.setEnabled(can_go_next)
         self.last_button.setEnabled(can_go_next)
         self.page_label.setText(page_str)
 
+    def refresh_ui_state(self):
+        """Refresh the result label and pager after the page changed."""
+        self.update_result_label()
+        self.update_page_text()
+
     def release_resources(self):
         self.result_table.is_error = False
         self.result_table.release_resources()
-        self.update_result_label()
-        self.update_page_text()
+        self.refresh_ui_state()
 
     def first_page(self):
         if self.result_table.first_page():
@@ -513,12 +640,10 @@ class ResultsController:
 
     def toggle_zebra_striping(self):
         self.result_table.toggle_zebra_striping()
-        if self._parent and hasattr(self._parent, "menu_controller"):
-            action = getattr(
-                self._parent.menu_controller, "toggle_zebra_striping_action", None
+        if self._parent.is_ui_ready():
+            self._parent.menu_controller.toggle_zebra_striping_action.setChecked(
+                self.result_table.is_zebra_striping_enabled()
             )
-            if action is not None:
-                action.setChecked(self.result_table.is_zebra_striping_enabled())
 
     def handle_page_hotkeys(self, key: int):
         match key:
@@ -539,7 +664,6 @@ class ResultsController:
 
     def _data_prepared(self, df: pd.DataFrame, query: str, page: int):
         self.result_table.is_error = False
-        self._parent.data_container.exit_query_thread()
         self.result_table.set_page(page)
         self.result_table.update_page_row_info()
         self.result_table.set_page_df(df)
@@ -552,24 +676,24 @@ class ResultsController:
         self._parent.sql_edit_controller.handle_edit_check()
 
     def _query_finished(self):
-        self.update_result_label()
-        self.update_page_text()
-        self.result_table.last_column_widths = None
+        self.refresh_ui_state()
         self._parent.update_window_title()
         self._parent.menu_controller.update_action_states()
         self._parent.stop_loading_animation()
 
-    def _on_current_row_changed(
-        self,
-        current_row: int | None,
-        current_column: int | None,
-        previous_row: int | None,
-        previous_column: int | None,
-    ):
-        if current_row is not None and current_row >= 0:
-            self.update_result_label(current_row, current_column)
-        else:
-            self.update_result_label()
+    def _on_current_row_changed(self, current: QModelIndex, previous: QModelIndex):
+        row, column = (
+            (current.row(), current.column()) if current.isValid() else (None, None)
+        )
+        if self.result_table.get_page_df() is not self._label_df:
+            self.update_result_label(row, column)
+            return
+        self._pending_selection = (row, column)
+        if not self._selection_label_timer.isActive():
+            self._selection_label_timer.start(30)
+
+    def _flush_selection_label(self):
+        self._set_selection_label(*self._pending_selection)
 
     def _show_context_menu(self, pos: QPoint):
         contextMenu = QMenu(self._parent)
@@ -626,18 +750,24 @@ class ResultsController:
         df = self.result_table.get_page_df()
         if df is None:
             return
-        values = cast(list[Any], df.iloc[:, column].tolist())
+        # pandas' csv writer formats the column without a Python list round-trip
+        values = df.iloc[:, column].to_csv(
+            index=False, header=False, lineterminator="\n"
+        )
         clipboard = QApplication.clipboard()
-        clipboard.setText(str(values))
+        clipboard.setText(values.removesuffix("\n"))
 
     def _copy_row_values(self, row: int, as_dict: bool = False):
         df = self.result_table.get_page_df()
         if df is None:
             return
         if not as_dict:
-            values = cast(list[Any], df.iloc[row, :].tolist())
+            values = df.iloc[row : row + 1].to_csv(
+                index=False, header=False, lineterminator="\n"
+            )
+            values = values.removesuffix("\n")
         else:
-            txt = cast(dict[str, Any], df.iloc[row, :].to_dict())
+            txt = self.result_table.get_row_dict(row)
             for key in list(txt.keys()):
                 if txt[key] is None or isinstance(txt[key], (int, float, bool, str)):
                     continue
@@ -665,7 +795,7 @@ class ResultsController:
         df = self.result_table.get_page_df()
         if not self._parent.data_container.is_file_open() or df is None:
             return
-        dict_values = cast(dict[str, Any], df.iloc[row, :].to_dict())
+        dict_values = self.result_table.get_row_dict(row)
         table_info = render_row_values(dict_values)
         return self.dialog_controller.show_table_dialog(
             f"Values for Row {row}", table_info
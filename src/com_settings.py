@@ -1,4 +1,5 @@
 from pathlib import Path
+import shutil
 from typing import Callable
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
@@ -19,15 +20,17 @@ from main import ParquetSQLApp
 
 class SettingsDialog(QDialog):
     # these settings won't be editable
-    read_only_fields = [
-        "recents_file",
-        "settings_file",
-        "default_settings_file",
-        "static_dir",
-        "usr_recents_file",
-        "usr_settings_file",
-        "user_app_settings_dir",
-    ]
+    read_only_fields = frozenset(
+        (
+            "recents_file",
+            "settings_file",
+            "default_settings_file",
+            "static_dir",
+            "usr_recents_file",
+            "usr_settings_file",
+            "user_app_settings_dir",
+        )
+    )
 
     help_text = (
         "Did you know:\nYou can use field names inside string as `$(field_name)` for render it."
@@ -85,9 +88,12 @@ class SettingsDialog(QDialog):
         layout = QFormLayout()
 
         self.fields: dict[str, QLineEdit] = {}
-        for field, value in self._settings.model_dump().items():
+        # read values straight off the model; model_dump() would deep-copy
+        # every field, including the read-only ones skipped below
+        for field in Settings.model_fields:
             if field in self.read_only_fields:
                 continue
+            value = getattr(self._settings, field)
 
             line_edit = QLineEdit()
             # line_edit.setPlaceholderText(str(value))
@@ -158,10 +164,7 @@ class SettingsDialog(QDialog):
         default_settings_file = (
             Path(__file__).parent / "settings" / "default_settings.json"
         )
-        with open(default_settings_file.as_posix(), "r") as f:
-            default_settings_data = f.read()
-        with self._settings.usr_settings_file.open("w") as f:
-            f.write(default_settings_data)
+        shutil.copyfile(default_settings_file, self._settings.usr_settings_file)
         self._settings = Settings.load_settings()
         QMessageBox.information(
             self,
@@ -172,8 +175,19 @@ class SettingsDialog(QDialog):
 
 
 class SettingsController:
+    # settings the loaded page depends on; other changes only restyle the UI
+    page_refresh_fields = frozenset(
+        (
+            "result_pagination_rows_per_page",
+            "default_data_var_name",
+        )
+    )
+
     def __init__(
-        self, parent: ParquetSQLApp, settings: Settings, update_fn: Callable[[], None]
+        self,
+        parent: ParquetSQLApp,
+        settings: Settings,
+        update_fn: Callable[[bool], None],
     ):
         self._settings = settings
         self._parent = parent
@@ -190,13 +204,21 @@ class SettingsController:
             )
             return
 
+        # the dialog writes into the shared model, so keep the values to diff
+        previous_values = dict(self._settings.__dict__)
         dialog = SettingsDialog(self._settings, default_settings_file)
         if dialog.exec_() == QDialog.Accepted:
-            self._handle_settings_changed()
+            self._handle_settings_changed(previous_values)
 
-    def _handle_settings_changed(self):
+    def _handle_settings_changed(self, previous_values: dict[str, object]):
         refreshed_settings = Settings.load_settings()
-        for field_name in Settings.model_fields:
-            setattr(self._settings, field_name, getattr(refreshed_settings, field_name))
+        # refreshed_settings is already validated, so copy its fields wholesale
+        # instead of going through BaseModel.__setattr__ once per field
+        self._settings.__dict__.update(refreshed_settings.__dict__)
+        reload_page = any(
+            previous_values.get(field) != getattr(refreshed_settings, field)
+            for field in self.page_refresh_fields
+        )
+        ParquetSQLApp.invalidate_instance_mode()
         ParquetSQLApp.refresh_all_instance_actions()
-        self._update_fn()
+        self._update_fn(reload_page)
@@ -1,15 +1,19 @@
-from typing import TYPE_CHECKING
-from PyQt5.QtCore import QPoint, QTimer, Qt, QStringListModel, pyqtSignal
+from typing import TYPE_CHECKING, Callable
+from PyQt5.QtCore import (
+    QPoint,
+    QSignalBlocker,
+    QTimer,
+    Qt,
+    QStringListModel,
+    pyqtSignal,
+)
 from PyQt5.QtGui import QKeyEvent, QTextCursor
 from PyQt5.QtWidgets import (
     QCompleter,
     QPushButton,
     QTextEdit,
 )
-from gui_tools import (
-    change_font_size,
-    render_df_info,
-)
+from gui_tools import render_df_info, set_style_sheet
 from components import SQLHighlighter
 
 if TYPE_CHECKING:
@@ -21,6 +25,7 @@ if TYPE_CHECKING:
 
 class AutoCompleteTextEdit(QTextEdit):
     execute_requested = pyqtSignal()
+    edit_key_pressed = pyqtSignal()
 
     def __init__(self):
         super().__init__()
@@ -28,6 +33,32 @@ class AutoCompleteTextEdit(QTextEdit):
         self._string_list_model: QStringListModel | None = None
         self._all_completions: list[str] = []
         self._recent_completions: list[str] = []
+        self._history_hotkey_handler: Callable[[int], bool] | None = None
+        self._page_hotkey_handler: Callable[[int], bool] | None = None
+
+    def set_hotkey_handlers(
+        self,
+        history_handler: Callable[[int], bool],
+        page_handler: Callable[[int], bool],
+    ):
+        """Ctrl+Up/Down and Ctrl+Left/Right handlers; return True when consumed."""
+        self._history_hotkey_handler = history_handler
+        self._page_hotkey_handler = page_handler
+
+    def _handle_hotkeys(self, key: int, modifiers: Qt.KeyboardModifiers) -> bool:
+        ctrl_only = bool(modifiers & Qt.ControlModifier) and not (
+            modifiers & (Qt.ShiftModifier | Qt.AltModifier)
+        )  # type: ignore
+        if ctrl_only and key in (Qt.Key_Up, Qt.Key_Down):
+            handler = self._history_hotkey_handler
+            return handler is not None and handler(key)
+        if ctrl_only and key in (Qt.Key_Left, Qt.Key_Right):
+            handler = self._page_hotkey_handler
+            return handler is not None and handler(key)
+        if key in (Qt.Key_Return, Qt.Key_Enter) and not (modifiers & Qt.ShiftModifier):  # type: ignore
+            self.execute_requested.emit()
+            return True
+        return False
 
     def set_completer(self, completer: QCompleter):
         if self._completer is not None:
@@ -110,8 +141,12 @@ class AutoCompleteTextEdit(QTextEdit):
         return text[start:end]
 
     def keyPressEvent(self, event: QKeyEvent):
-        print(event.key())
-        if self._completer and self._completer.popup().isVisible():
+        popup_visible = self.is_completion_visible()
+        if not popup_visible and self._handle_hotkeys(event.key(), event.modifiers()):
+            return
+        self.edit_key_pressed.emit()
+
+        if popup_visible:
             match event.key():
                 case Qt.Key_Enter | Qt.Key_Return:
                     popup = self._completer.popup()
@@ -228,7 +263,23 @@ class SqlEditController:
         self._sql_edit_dirty: bool = False
         self._history_index: int | None = None
         self._history_snapshot: str | None = None
+        # one restartable timer so a typing burst runs a single trailing check
+        self._edit_check_timer = QTimer()
+        self._edit_check_timer.setSingleShot(True)
+        self._edit_check_timer.timeout.connect(self._run_edit_check)
+        self._edit_check_handle_history = False
+        # query history is written to disk once a burst of executions settles
+        self._history_save_timer = QTimer()
+        self._history_save_timer.setSingleShot(True)
+        self._history_save_timer.timeout.connect(self._history.save_history)
+        # stripped copy of the last executed query, keyed by the source string
+        self._queried_source: str | None = None
+        self._queried_stripped = ""
         self._highlighter = None
+        # last column list pushed to the highlighter
+        self._highlighted_columns: list[str] | None = None
+        # (columns, rendered table name, keywords) the completer was built from
+        self._completion_key: tuple[tuple[str, ...], str, tuple[str, ...]] | None = None
         self._auto_complete_model = QStringListModel()
         self._auto_complete_completer = QCompleter(self._auto_complete_model)
         self._auto_complete_completer.setCaseSensitivity(Qt.CaseInsensitive)
@@ -245,6 +296,10 @@ class SqlEditController:
         )
         self.sql_edit.set_completer(self._auto_complete_completer)
         self.sql_edit.execute_requested.connect(self.execute_query)
+        self.sql_edit.edit_key_pressed.connect(self.handle_edit_check)
+        self.sql_edit.set_hotkey_handlers(
+            self.handle_history_hotkeys, results_controller.handle_page_hotkeys
+        )
         self.update_auto_complete_words([])
 
         self.execute_button = QPushButton("Execute")
@@ -267,14 +322,18 @@ class SqlEditController:
         self.table_info_button.clicked.connect(self.toggle_table_info)
 
     def update_highlighter_columns(self, columns: list[str]):
-        if self._highlighter is not None:
-            self._highlighter.update_columns(columns)
+        if self._highlighter is None or columns == self._highlighted_columns:
+            return
+        self._highlighter.update_columns(columns)
+        self._highlighted_columns = list(columns)
 
     def update_auto_complete_words(self, words: list[str]):
-        base_words = [
-            self._settings.render_vars(self._settings.default_data_var_name),
-            *self._settings.sql_keywords,
-        ]
+        table_name = self._settings.render_vars(self._settings.default_data_var_name)
+        completion_key = (tuple(words), table_name, tuple(self._settings.sql_keywords))
+        if completion_key == self._completion_key:
+            return
+        self._completion_key = completion_key
+        base_words = [table_name, *self._settings.sql_keywords]
         merged_words = base_words + words
         deduped: list[str] = []
         seen: set[str] = set()
@@ -301,9 +360,19 @@ class SqlEditController:
         if not self._data_container.is_file_open() or not data:
             return
 
-        table_info = render_df_info(data.reader.duckdf_query)
+        reader = data.reader
+        if reader.table_info is None:
+            reader.table_info = render_df_info(reader.duckdf_query)
+
+        return self._dialog_controller.show_table_dialog(
+            "Table Info", reader.table_info
+        )
 
-        return self._dialog_controller.show_table_dialog("Table Info", table_info)
+    def flush_history(self):
+        """Write a pending query history save immediately."""
+        if self._history_save_timer.isActive():
+            self._history_save_timer.stop()
+            self._history.save_history()
 
     def reset_history_navigation(self):
         self._history_index = None
@@ -322,20 +391,20 @@ class SqlEditController:
         """Configure SQL editor colours and border state."""
 
         self._apply_edit_styles()
-        self.execute_button.setStyleSheet(
-            f"background-color: {self._settings.colour_executeButton}"
+        set_style_sheet(
+            self.execute_button,
+            f"background-color: {self._settings.colour_executeButton}",
         )
-        self.table_info_button.setStyleSheet(
-            f"background-color: {self._settings.colour_tableInfoButton}"
+        set_style_sheet(
+            self.table_info_button,
+            f"background-color: {self._settings.colour_tableInfoButton}",
         )
-        change_font_size(self._settings, self.execute_button)
-        change_font_size(self._settings, self.default_button)
-        change_font_size(self._settings, self.table_info_button)
         font = self.sql_edit.font()
         font.setFamily(self._settings.default_sql_font)
         font.setPointSize(int(self._settings.default_sql_font_size))
         self.sql_edit.setFont(font)
         self._highlighter = SQLHighlighter(self.sql_edit.document(), self._settings)
+        self._highlighted_columns = None
 
     def handle_history_hotkeys(self, key: int):
         match key:
@@ -356,20 +425,32 @@ class SqlEditController:
         return self._show_previous_history_entry()
 
     def handle_edit_check(self, handle_history: bool = True):
-        def delayed_handle_edit_check():
-            queried = self._data_container.queried
-            if queried is None:
-                return
-            text_changed = queried.strip() != self.sql_edit.toPlainText().strip()
-            if handle_history and self._history_index is not None and text_changed:
-                self.reset_history_navigation()
-
-            if text_changed:
-                self._mark_sql_edit_dirty(True)
-            else:
-                self._mark_sql_edit_dirty(False)
+        self._edit_check_handle_history |= handle_history
+        self._edit_check_timer.start(50)
+
+    def _run_edit_check(self):
+        handle_history = self._edit_check_handle_history
+        self._edit_check_handle_history = False
+        queried = self._data_container.queried
+        if queried is None:
+            return
+        if queried is not self._queried_source:
+            self._queried_source = queried
+            self._queried_stripped = queried.strip()
+        # the editor text can only match if it is at least as long as the
+        # stripped query, which lets short edits skip copying the document
+        text_length = self.sql_edit.document().characterCount() - 1
+        text_changed = (
+            text_length < len(self._queried_stripped)
+            or self._queried_stripped != self.sql_edit.toPlainText().strip()
+        )
+        if handle_history and self._history_index is not None and text_changed:
+            self.reset_history_navigation()
 
-        QTimer.singleShot(50, delayed_handle_edit_check)
+        if text_changed:
+            self._mark_sql_edit_dirty(True)
+        else:
+            self._mark_sql_edit_dirty(False)
 
     def _mark_sql_edit_dirty(self, dirty: bool):
         if self._sql_edit_dirty == dirty:
@@ -392,30 +473,28 @@ class SqlEditController:
 
         query = query_text.strip()
         file_path_str = str(file_path)
+        entries = self._history.queries.get(file_path_str)
 
         if (
             self._history_index is not None
-            and file_path_str in self._history.queries
-            and self._history.queries[file_path_str][self._history_index] == query
+            and entries
+            and entries[self._history_index] == query
         ):
             return
         if query:
-            self._history.add_query(file_path_str, query_text)
+            self._history.add_query(file_path_str, query_text, save=False)
+            self._history_save_timer.start(10000)
         self.reset_history_navigation()
 
-    def _begin_history_navigation(self) -> bool:
+    def _get_history_entries(self) -> list[str] | None:
+        """Saved queries of the open file, most recent first."""
         file_path = self._data_container.get_file_path()
         if file_path is None:
-            return False
-
-        file_path_str = str(file_path)
+            return None
+        return self._history.queries.get(str(file_path)) or None
 
-        if (
-            file_path_str not in self._history.queries
-            or not self._history.queries[file_path_str]
-        ):
-            return False
-        return True
+    def _begin_history_navigation(self) -> bool:
+        return self._get_history_entries() is not None
 
     def _apply_edit_styles(self):
         background_colour = self._settings.colour_sqlEdit
@@ -424,33 +503,31 @@ class SqlEditController:
             if self._sql_edit_dirty
             else self._settings.SQL_EDIT_CLEAN_BORDER
         )
-        self.sql_edit.setStyleSheet(
-            f"background-color: {background_colour}; border: {border_style};"
+        set_style_sheet(
+            self.sql_edit,
+            f"background-color: {background_colour}; border: {border_style};",
         )
 
     def _apply_history_entry(self, text: str):
-        previous_state = self.sql_edit.blockSignals(True)
-        try:
-            self.sql_edit.setPlainText(text)
+        with QSignalBlocker(self.sql_edit):
+            # re-setting identical text would rebuild and re-highlight the document
+            text_length = self.sql_edit.document().characterCount() - 1
+            if text_length != len(text) or self.sql_edit.toPlainText() != text:
+                self.sql_edit.setPlainText(text)
             cursor = self.sql_edit.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            self.sql_edit.setTextCursor(cursor)
-        finally:
-            self.sql_edit.blockSignals(previous_state)
+            if not cursor.atEnd():
+                cursor.movePosition(QTextCursor.End)
+                self.sql_edit.setTextCursor(cursor)
 
     def _show_previous_history_entry(self) -> bool:
-        if not self._begin_history_navigation():
+        entries = self._get_history_entries()
+        if entries is None:
             return False
-        file_path = self._data_container.get_file_path()
-        if file_path is None:
-            return False
-        file_path_str = str(file_path)
         if self._history_index is None:
             self._history_snapshot = self.sql_edit.toPlainText()
             self._history_index = 0
-        elif self._history_index + 1 < len(self._history.queries[file_path_str]):
+        elif self._history_index + 1 < len(entries):
             self._history_index += 1
-        entries = self._history.queries[file_path_str]
         entry = entries[self._history_index]
         self._apply_history_entry(entry)
         self.execute_button.setText(
@@ -460,21 +537,11 @@ class SqlEditController:
         return True
 
     def _show_next_history_entry(self) -> bool:
-        file_path = self._data_container.get_file_path()
-        if file_path is None:
-            return False
-        file_path_str = str(file_path)
-        if (
-            file_path_str not in self._history.queries
-            or not self._history.queries[file_path_str]
-        ):
-            return False
-        if self._history_index is None:
+        entries = self._get_history_entries()
+        if entries is None or self._history_index is None:
             return False
-        assert self._history_index is not None
         if self._history_index > 0:
             self._history_index -= 1
-            entries = self._history.queries[file_path_str]
             entry = entries[self._history_index]
             self._apply_history_entry(entry)
             self.execute_button.setText(
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Any, Callable
 from pathlib import Path
+import threading
 from PyQt5.QtWidgets import (
     QLabel,
     QMessageBox,
@@ -13,7 +14,11 @@ from PyQt5.QtGui import (
     QColor,
     QFont,
     QMovie,
+    QPainter,
+    QPaintEvent,
+    QPalette,
     QPixmap,
+    QPixmapCache,
     QResizeEvent,
     QSyntaxHighlighter,
     QTextCharFormat,
@@ -21,13 +26,20 @@ from PyQt5.QtGui import (
     QTextCursor,
 )
 from PyQt5.QtCore import (
+    QAbstractTableModel,
     QModelIndex,
+    QObject,
+    QPoint,
+    QRect,
     QRegExp,
+    QRunnable,
     QSize,
     QThread,
+    QThreadPool,
     Qt,
     pyqtSignal,
 )
+import numpy as np
 import pandas as pd
 from query_revisor import Revisor, BadQueryException
 from schemas import Settings
@@ -41,22 +53,34 @@ if TYPE_CHECKING:
     from PyQt5.QtGui import QShowEvent, QTextDocument
 
 
-class QueryThread(QThread):
+class QuerySignals(QObject):
     result_ready = pyqtSignal(pd.DataFrame, str, int)
     error_occurred = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class QueryRunnable(QRunnable):
+    """Runs a query on a pooled worker thread and reports back through `signals`."""
 
     def __init__(
         self,
         data: Data,
         nth_batch: int,
-        app: ParquetSQLApp,
         query: str | None = None,
     ):
         super().__init__()
         self.query = query
         self.nth_batch = nth_batch
         self.data = data
-        self.app = app
+        self.signals = QuerySignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Drop the results of this run; the worker stops at the next checkpoint."""
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
 
     def query_revisor(self, query: str) -> str | BadQueryException | None:
         """do checking and changes in query before it goes to run"""
@@ -68,6 +92,8 @@ class QueryThread(QThread):
             return rev_res
 
     def run(self):
+        if self.is_cancelled():
+            return
 
         try:
             if self.query and self.query.strip():
@@ -78,15 +104,68 @@ class QueryThread(QThread):
                 if isinstance(query, str):
                     self.data.execute_query(query, as_df=False)
 
+            if self.is_cancelled():
+                return
             df = self.data.get_nth_batch(n=self.nth_batch, as_df=True)
-            self.result_ready.emit(df, self.query, self.nth_batch)
+            if self.is_cancelled():
+                return
+            self.signals.result_ready.emit(df, self.query, self.nth_batch)
 
         except Exception as e:
+            if self.is_cancelled():
+                return
             err_message = f"""
                             An error occurred while executing the query: '{self.query}'\n
                             Error: '{str(e)}'
                         """
-            self.error_occurred.emit(err_message)
+            self.signals.error_occurred.emit(err_message)
+
+        self.signals.finished.emit()
+
+
+class ExportSignals(QObject):
+    finished = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+
+
+class ExportRunnable(QRunnable):
+    """Writes a query result to disk on a pooled worker thread."""
+
+    def __init__(self, write_fn: Callable[[str], Any], file_path: str):
+        super().__init__()
+        self.write_fn = write_fn
+        self.file_path = file_path
+        self.signals = ExportSignals()
+
+    def run(self):
+        try:
+            self.write_fn(self.file_path)
+        except Exception as e:
+            self.signals.error_occurred.emit(
+                f"An error occurred while exporting to '{self.file_path}'\n"
+                f"Error: '{str(e)}'"
+            )
+            return
+        self.signals.finished.emit(self.file_path)
+
+
+class LoadingOverlay(QWidget):
+    """Translucent cover that dims its parent while a query is running.
+
+    Painting one filled rect over the parent is far cheaper than a
+    ``QGraphicsOpacityEffect``, which re-renders the whole table offscreen.
+    """
+
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._color = QColor(parent.palette().color(QPalette.Window))
+        self._color.setAlpha(166)
+        self.hide()
+
+    def paintEvent(self, event: QPaintEvent):
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self._color)
 
 
 class AnimationWidget(QWidget):
@@ -451,7 +530,13 @@ class SearchableTextBrowser(QTextBrowser):
 
 
 class AutoWrapDelegate(QStyledItemDelegate):
-    """Delegate that wraps text when the row is tall enough but still elides overflow."""
+    """Delegate that wraps text when the row is tall enough but still elides overflow.
+
+    Rendered cells are kept in `QPixmapCache` keyed by text, size, font and
+    state, so repaints while scrolling skip the text layout engine.
+    """
+
+    PIXMAP_CACHE_LIMIT_KB = 20 * 1024
 
     def __init__(
         self,
@@ -460,6 +545,8 @@ class AutoWrapDelegate(QStyledItemDelegate):
     ):
         super().__init__(parent)
         self.min_wrapped_lines = max(1, min_wrapped_lines)
+        if QPixmapCache.cacheLimit() < self.PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT_KB)
 
     def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
         super().initStyleOption(option, index)
@@ -473,6 +560,155 @@ class AutoWrapDelegate(QStyledItemDelegate):
             option.features &= ~QStyleOptionViewItem.WrapText  # type: ignore
             option.displayAlignment = Qt.AlignLeft | Qt.AlignVCenter
 
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
+    ):
+        rect = option.rect
+        if rect.isEmpty():
+            return
+        text = index.data(Qt.DisplayRole) or ""
+        dpr = painter.device().devicePixelRatioF()
+        key = (
+            f"cell:{len(text)}:{hash(text)}:{rect.width()}x{rect.height()}@{dpr}:"
+            f"{option.font.key()}:{int(option.state)}:{int(option.features)}"
+        )
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(rect.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            local_option = QStyleOptionViewItem(option)
+            local_option.rect = QRect(QPoint(0, 0), rect.size())
+            pixmap_painter = QPainter(pixmap)
+            super().paint(pixmap_painter, local_option, index)
+            pixmap_painter.end()
+            QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+
+# extension dtypes whose vectorized astype(str) matches str() of every value
+_STR_SAFE_EXTENSION_DTYPES = (
+    pd.Int64Dtype,
+    pd.Float64Dtype,
+    pd.BooleanDtype,
+    pd.StringDtype,
+)
+
+
+def _format_display_column(column: pd.Series) -> np.ndarray:
+    """Stringify a column in one pass, matching `str()` of each cell value."""
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        return column.to_numpy().astype(str).astype(object)
+    if not isinstance(dtype, _STR_SAFE_EXTENSION_DTYPES):
+        # e.g. ArrowDtype timestamps: astype(str) gives ISO text, not str(Timestamp)
+        values = column.to_numpy(dtype=object)
+        return np.fromiter(map(str, values), dtype=object, count=len(values))
+
+    # pandas formats valid values, missing ones keep their repr
+    mask = column.isna().to_numpy(dtype=bool)
+    if not mask.any():
+        return column.astype(str).to_numpy(dtype=object)
+    display = np.empty(len(column), dtype=object)
+    display[~mask] = column[~mask].astype(str).to_numpy(dtype=object)
+    display[mask] = [str(value) for value in column.to_numpy(dtype=object)[mask]]
+    return display
+
+
+class DataFrameModel(QAbstractTableModel):
+    """Read-only table model serving cells straight from a pandas DataFrame.
+
+    Rows are exposed to the view in batches through `canFetchMore`/`fetchMore`,
+    so display strings are only built for rows the user has scrolled to.
+    """
+
+    FETCH_BATCH_ROWS = 200
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._df: pd.DataFrame | None = None
+        self._display: np.ndarray | None = None
+        self._column_names: list[str] = []
+        self._header_labels: list[str] = []
+        self._row_offset = 0
+        self._loaded_rows = 0
+
+    def set_dataframe(self, df: pd.DataFrame | None, row_offset: int = 0):
+        self.beginResetModel()
+        self._df = df
+        self._display = None
+        self._loaded_rows = 0
+        column_names = (
+            [str(col) for col in df.columns] if df is not None else []  # type: ignore
+        )
+        if column_names != self._column_names:
+            # paging keeps the column set, so the labels usually carry over
+            self._column_names = column_names
+            self._header_labels = [
+                f"{idx + 1}\n{name}" for idx, name in enumerate(column_names)
+            ]
+        if df is not None:
+            self._display = np.empty(df.shape, dtype=object)
+            self._format_rows(min(self.FETCH_BATCH_ROWS, len(df.index)))
+        self._row_offset = row_offset
+        self.endResetModel()
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or self._df is None:
+            return False
+        return self._loaded_rows < len(self._df.index)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if parent.isValid() or self._df is None:
+            return
+        start = self._loaded_rows
+        count = min(self.FETCH_BATCH_ROWS, len(self._df.index) - start)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, start, start + count - 1)
+        self._format_rows(count)
+        self.endInsertRows()
+
+    def _format_rows(self, count: int):
+        """Fill display strings for the next `count` rows."""
+        assert self._df is not None and self._display is not None
+        start = self._loaded_rows
+        end = start + count
+        for idx in range(self._display.shape[1]):
+            self._display[start:end, idx] = _format_display_column(
+                self._df.iloc[start:end, idx]
+            )
+        self._loaded_rows = end
+
+    def get_dataframe(self) -> pd.DataFrame | None:
+        return self._df
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._loaded_rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._column_names)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole or self._display is None or not index.isValid():
+            return None
+        return self._display[index.row(), index.column()]
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
+    ) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            if 0 <= section < len(self._header_labels):
+                return self._header_labels[section]
+            return None
+        return str(self._row_offset + section + 1)
+
 
 class DataContainer:
     def __init__(
@@ -490,8 +726,13 @@ class DataContainer:
         self._query_finished_fn = _not_bound_fn
         self._data_prepared_fn = _not_bound_fn
         self._data_loader = None
-        self._query_thread = None
+        # a single pooled worker keeps queries on the same relation serialized
+        self._query_pool = QThreadPool()
+        self._query_pool.setMaxThreadCount(1)
+        self._query_runnable: QueryRunnable | None = None
+        self._export_runnable: ExportRunnable | None = None
         self._file_path = None
+        self._resolved_file_path: Path | None = None
         self.data: Data | None = None
         self._pending_query: str | None = None
         self.queried: str | None = None
@@ -506,12 +747,6 @@ class DataContainer:
         self._error_fn = error_fn
         self._query_finished_fn = query_finished_fn
 
-    def exit_query_thread(self):
-        if self._query_thread:
-            self._query_thread.quit()
-            self._query_thread.wait()
-            self._query_thread = None
-
     def load_page(self, page: int, query: str | None = None):
         if not self._file_path:
             self._parent.result_controller.result_label.setText("Browse file first...")
@@ -527,7 +762,7 @@ class DataContainer:
         if self.data is None:
             self.start_data_loader(str(self._file_path))
         else:
-            self._start_query_thread(page, query)
+            self._start_query(page, query)
 
     def reload_file(self):
         if not self._file_path:
@@ -552,6 +787,8 @@ class DataContainer:
             return False
 
         self._file_path = path
+        self._resolved_file_path = path.resolve()
+        self._parent.update_file_index()
         self._parent.update_window_title()
         self._parent.menu_controller.update_action_states()
         self.release_resources()
@@ -576,13 +813,13 @@ class DataContainer:
         if not self._file_path:
             return
         self._file_path = None
+        self._resolved_file_path = None
+        self._parent.update_file_index()
         self.release_resources()
 
     def release_resources(self):
-        if self._query_thread and self._query_thread.isRunning():
-            self._query_thread.quit()
-            self._query_thread.wait()
-        self._query_thread = None
+        self._cancel_query()
+        self._query_pool.waitForDone()
 
         if self._data_loader and self._data_loader.isRunning():
             self._data_loader.quit()
@@ -600,6 +837,10 @@ class DataContainer:
     def get_file_path(self) -> Path | None:
         return self._file_path
 
+    def get_resolved_file_path(self) -> Path | None:
+        """Resolved form of the open file path, computed once when it was opened."""
+        return self._resolved_file_path
+
     def start_data_loader(self, file_path: str):
         if self._data_loader and self._data_loader.isRunning():
             return
@@ -634,29 +875,54 @@ class DataContainer:
             loader.wait()
             loader.deleteLater()
         self._data_loader = None
-        self._start_query_thread(1, self._pending_query)
+        self._start_query(1, self._pending_query)
 
-    def _start_query_thread(self, page: int, query: str | None):
+    def _start_query(self, page: int, query: str | None):
         if not self.data:
             return
 
-        if self._query_thread and self._query_thread.isRunning():
-            self._query_thread.quit()
-            self._query_thread.wait()
+        self._cancel_query()
+        runnable = QueryRunnable(data=self.data, query=query, nth_batch=page)
+        runnable.signals.result_ready.connect(self._data_prepared_fn)
+        runnable.signals.error_occurred.connect(self._handle_error)
+        runnable.signals.finished.connect(self._query_finished_fn)
+        self._query_runnable = runnable
+        self._query_pool.start(runnable)
 
-        self._query_thread = QueryThread(
-            data=self.data, query=query, nth_batch=page, app=self._parent
-        )
-        self._query_thread.result_ready.connect(self._data_prepared_fn)
-        self._query_thread.error_occurred.connect(self._handle_error)
-        self._query_thread.finished.connect(self._query_finished_fn)
-        self._query_thread.start()
+    def start_export(
+        self,
+        write_fn: Callable[[str], Any],
+        file_path: str,
+        finished_fn: Callable[[str], None],
+        error_fn: Callable[[str], None],
+    ):
+        """Run `write_fn(file_path)` on the query pool, after any running query."""
+        runnable = ExportRunnable(write_fn, file_path)
+
+        def _clear_export_reference(*_: Any):
+            if self._export_runnable is runnable:
+                self._export_runnable = None
+
+        runnable.signals.finished.connect(_clear_export_reference)
+        runnable.signals.error_occurred.connect(_clear_export_reference)
+        runnable.signals.finished.connect(finished_fn)
+        runnable.signals.error_occurred.connect(error_fn)
+        self._export_runnable = runnable
+        self._query_pool.start(runnable)
+
+    def is_exporting(self) -> bool:
+        return self._export_runnable is not None
+
+    def _cancel_query(self):
+        """Discard the pending/running query so its results are never delivered."""
+        if self._query_runnable is not None:
+            # a queued cancelled run returns immediately, so the pool is not
+            # cleared; that would also drop a pending export
+            self._query_runnable.cancel()
+            self._query_runnable = None
 
     def _handle_error(self, error: str):
-        if self._query_thread and self._query_thread.isRunning():
-            self._query_thread.quit()
-            self._query_thread.wait()
-            self._query_thread = None
+        self._query_runnable = None
 
         if self._data_loader and self._data_loader.isRunning():
             self._data_loader.quit()
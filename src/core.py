@@ -78,6 +78,8 @@ class Reader:
         self.total_view_rows: int = 0
         self.columns_query = list(self.duckdf_query.columns)
         self.columns = list(self.duckdf.columns)
+        # rendered describe() of duckdf_query, filled on first Table Info request
+        self.table_info: str | None = None
         self.update_batches()
         self.total_rows = self.total_view_rows
 
@@ -171,6 +173,7 @@ class Reader:
         # update duckdf_query and metadata
         logger.debug("Updating duckdf_query with query result")
         self.duckdf_query = duck_res
+        self.table_info = None
         self.update_batches()
         return duck_res.to_df() if as_df else duck_res
 
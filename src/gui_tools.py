@@ -1,10 +1,11 @@
 from typing import Any, TYPE_CHECKING
+from functools import lru_cache
 from io import StringIO
 import math
 import sys
 from PyQt5.QtGui import QFont, QTextDocument
-import re
 from PyQt5.QtWidgets import QWidget
+import re
 import duckdb
 import json
 
@@ -27,6 +28,47 @@ th, td {
 
 ZEBRA_ODD_BG = "#f0efeb"
 
+_TABLE_STYLE_BLOCK = f"<style>{TABLE_MARKDOWN_STYLESHEET}</style>"
+_HTML_TABLE_PATTERN = re.compile(r"(<table[^>]*>)(.*?)(</table>)", flags=re.DOTALL)
+_HTML_TR_PATTERN = re.compile(r"<tr[^>]*>")
+
+INSTANCE_MODE_SINGLE = "single"
+INSTANCE_MODE_MULTI_WINDOW = "multi_window"
+_MULTI_MODE_TOKENS = frozenset(
+    (
+        "multi",
+        "multi_instance",
+        "multi-instance",
+        "multiwindow",
+        "multi_window",
+        "multiwindows",
+        "multiple",
+        "windows",
+        "true",
+        "yes",
+        "on",
+    )
+)
+_SINGLE_MODE_TOKENS = frozenset(
+    (
+        "single",
+        "single_instance",
+        "single-instance",
+        "singlewindow",
+        "single_window",
+        "one",
+        "1",
+        "false",
+        "no",
+        "off",
+    )
+)
+# every accepted spelling maps straight to its canonical mode
+_INSTANCE_MODE_LOOKUP: dict[str, str] = {
+    **{token: INSTANCE_MODE_MULTI_WINDOW for token in _MULTI_MODE_TOKENS},
+    **{token: INSTANCE_MODE_SINGLE for token in _SINGLE_MODE_TOKENS},
+}
+
 
 def render_df_info(duckdf: duckdb.DuckDBPyRelation) -> str:
     """returns md like formatted df.info"""
@@ -388,77 +430,68 @@ def _apply_zebra_striping(html: str) -> str:
                 )
             return tag
 
-        styled_content = re.sub(r"<tr[^>]*>", style_row, table_content)
+        styled_content = _HTML_TR_PATTERN.sub(style_row, table_content)
         return before_table + styled_content + after_table
 
-    return re.sub(r"(<table[^>]*>)(.*?)(</table>)", replace_tr, html, flags=re.DOTALL)
+    return _HTML_TABLE_PATTERN.sub(replace_tr, html)
+
+
+def markdown_to_html(markdown_text: str, font: QFont) -> str:
+    return _render_markdown(markdown_text, font.family(), font.pointSize(), False)
 
 
 def markdown_to_html_with_table_styles(markdown_text: str, table_font: QFont) -> str:
+    return _render_markdown(
+        markdown_text, table_font.family(), table_font.pointSize(), True
+    )
+
+
+@lru_cache(maxsize=16)
+def _render_markdown(
+    markdown_text: str, font_family: str, font_size: int, table_styles: bool
+) -> str:
+    """Markdown to HTML, memoized so reopening a dialog skips Qt's parser.
+
+    toHtml() pins the default font into the body style, so it is part of the key.
+    """
     doc = QTextDocument()
-    doc.setDefaultFont(table_font)
+    doc.setDefaultFont(QFont(font_family, font_size))
     doc.setMarkdown(markdown_text)
     html = doc.toHtml()
+    if not table_styles:
+        return html
     html = html.replace("%%BR%%", "<br>")
     html = html.replace("%%TAB%%", "&nbsp;&nbsp;&nbsp;&nbsp;")
     html = _apply_zebra_striping(html)
-    style_block = f"<style>{TABLE_MARKDOWN_STYLESHEET}</style>"
     if "<head>" in html:
-        return html.replace("<head>", f"<head>{style_block}", 1)
-    return f"{style_block}{html}"
+        return html.replace("<head>", f"<head>{_TABLE_STYLE_BLOCK}", 1)
+    return f"{_TABLE_STYLE_BLOCK}{html}"
+
+
+def set_style_sheet(widget: QWidget, style_sheet: str) -> bool:
+    """Apply a stylesheet only when it differs, sparing Qt a full re-polish."""
+    if widget.styleSheet() == style_sheet:
+        return False
+    widget.setStyleSheet(style_sheet)
+    return True
 
 
 def normalize_instance_mode_value(value: str | None) -> str:
-    _MULTI_MODE_TOKENS = {
-        "multi",
-        "multi_instance",
-        "multi-instance",
-        "multiwindow",
-        "multi_window",
-        "multiwindows",
-        "multiple",
-        "windows",
-        "true",
-        "yes",
-        "on",
-    }
-    _SINGLE_MODE_TOKENS = {
-        "single",
-        "single_instance",
-        "single-instance",
-        "singlewindow",
-        "single_window",
-        "one",
-        "1",
-        "false",
-        "no",
-        "off",
-    }
     if value is None:
-        return "single"
-    normalized = str(value).strip().lower()
-    if normalized in ("single", "multi_window"):
-        return normalized
-    if normalized in _MULTI_MODE_TOKENS:
-        return "multi_window"
-    if normalized in _SINGLE_MODE_TOKENS:
-        return "single"
-    raise ValueError(f"Unsupported instance mode value: {value}")
+        return INSTANCE_MODE_SINGLE
+    try:
+        return _INSTANCE_MODE_LOOKUP[str(value).strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported instance mode value: {value}") from None
 
 
 def get_instance_mode(settings: Settings) -> str:
-    raw_mode = getattr(settings, "instance_mode", "single")
+    raw_mode = getattr(settings, "instance_mode", INSTANCE_MODE_SINGLE)
     try:
         return normalize_instance_mode_value(raw_mode)
     except ValueError:
-        return "single"
+        return INSTANCE_MODE_SINGLE
 
 
 def is_multi_window_mode(settings: Settings) -> bool:
-    return get_instance_mode(settings) == "multi_window"
-
-
-def change_font_size(settings: Settings, component: QWidget):
-    font = component.font()
-    font.setPointSize(int(settings.default_ui_font_size))
-    component.setFont(font)
+    return get_instance_mode(settings) == INSTANCE_MODE_MULTI_WINDOW
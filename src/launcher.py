@@ -1,27 +1,36 @@
 from pathlib import Path
 import tempfile
-import json
+import struct
 import time
 import subprocess
 import sys
 
 SINGLE_INSTANCE_SERVER_NAME = "ParVuExSingleInstance"
 INSTANCE_LOCK_PATH = Path(tempfile.gettempdir()) / "parvuex-single-instance.lock"
-INSTANCE_MESSAGE_KEY = "file"
+# version byte, then per file a little-endian u32 length and the utf-8 path
+INSTANCE_PROTO_VERSION = 2
 
 _parvuex_exe_cache = None
 
 
-def _notify_running_instance(file_path: str | None) -> bool:
+def _encode_instance_message(file_paths: list[str]) -> bytes:
+    payload = bytearray((INSTANCE_PROTO_VERSION,))
+    for file_path in file_paths:
+        encoded = file_path.encode("utf-8")
+        payload += struct.pack("<I", len(encoded))
+        payload += encoded
+    return bytes(payload)
+
+
+def _notify_running_instance(file_paths: list[str]) -> bool:
     from PyQt5.QtNetwork import QLocalSocket
 
-    message = json.dumps({INSTANCE_MESSAGE_KEY: file_path})
+    payload = _encode_instance_message(file_paths)
     attempts = 3
     for attempt in range(attempts):
         socket = QLocalSocket()
         socket.connectToServer(SINGLE_INSTANCE_SERVER_NAME)
         if socket.waitForConnected(300):
-            payload = message.encode("utf-8")
             socket.write(payload)
             socket.flush()
             socket.waitForBytesWritten(300)
@@ -67,10 +76,9 @@ def _parvuex_executable() -> Path:
 
 if __name__ == "__main__":
 
-    file_path = sys.argv[1] if len(sys.argv) > 1 else None
     instance_lock = _acquire_instance_lock()
     if instance_lock is None:
-        if _notify_running_instance(file_path):
+        if _notify_running_instance(sys.argv[1:]):
             sys.exit(0)
         print(
             "Another ParVuEx instance appears to be running but could not be contacted."
@@ -83,6 +83,9 @@ class Settings(BaseModel):
 
     def render_vars(self, query: str) -> str:
         """render inside the query the vars of the settings"""
+        if "$(" not in query:
+            # most values (page size, table name) hold no placeholders at all
+            return query
 
         query = query.replace(
             "$(default_data_var_name)", str(self.default_data_var_name)
@@ -207,9 +210,17 @@ class Recents(BaseModel):
 recents = Recents.load_recents()
 
 
+class HeaderState(BaseModel):
+    """Result table header layout saved by QHeaderView.saveState()"""
+
+    columns: list[str]
+    state: str  # base64 encoded
+
+
 class History(BaseModel):
     queries: dict[str, list[str]]
     col_width: dict[str, dict[str, int]]
+    header_state: dict[str, HeaderState] = {}
 
     @classmethod
     def load_history(cls):
@@ -222,8 +233,13 @@ class History(BaseModel):
         model = cls.model_validate_json(history_data)
         return model
 
-    def add_col_width(self, file_path: str, column_widths: dict[str, int] | None):
-        """Persist the latest column widths for a file."""
+    def add_col_width(
+        self,
+        file_path: str,
+        column_widths: dict[str, int] | None,
+        header_state: HeaderState | None = None,
+    ):
+        """Persist the latest column widths (and header layout) for a file."""
         changed = False
         if column_widths:
             if file_path not in self.col_width:
@@ -233,10 +249,16 @@ class History(BaseModel):
                 if self.col_width.get(file_path) != column_widths:
                     self.col_width[file_path] = column_widths
                     changed = True
+            if header_state and self.header_state.get(file_path) != header_state:
+                self.header_state[file_path] = header_state
+                changed = True
         else:
             if file_path in self.col_width:
                 del self.col_width[file_path]
                 changed = True
+            if file_path in self.header_state:
+                del self.header_state[file_path]
+                changed = True
 
         if changed:
             self.save_history()
@@ -246,7 +268,14 @@ class History(BaseModel):
         stored = self.col_width.get(file_path, {})
         return dict(stored)
 
-    def add_query(self, file_path: str, query: str):
+    def get_header_state(self, file_path: str, columns: list[str]) -> str | None:
+        """Return the saved header layout if it was saved for the same columns."""
+        stored = self.header_state.get(file_path)
+        if stored is None or stored.columns != columns:
+            return None
+        return stored.state
+
+    def add_query(self, file_path: str, query: str, save: bool = True):
         # add query to history
         try:
             idx = self.queries[file_path].index(query)
@@ -259,7 +288,8 @@ class History(BaseModel):
             self.queries[file_path] = self.queries[file_path][:50]
         elif len(self.queries[file_path]) == 0:
             del self.queries[file_path]
-        self.save_history()
+        if save:
+            self.save_history()
 
     def save_history(self):
         # Save current recents to JSON file
@@ -1,6 +1,7 @@
 """module contains general purpose tools"""
 
 import ctypes
+from functools import cache
 import os
 from pathlib import Path
 import sys
@@ -61,15 +62,54 @@ def get_resource_path(relative_path: str) -> Path:
     return base_path / relative_path
 
 
+@cache
+def require_resource_path(relative_path: str) -> Path:
+    """Bundled resource path, checked for existence once per process."""
+    path = get_resource_path(relative_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Resource file not found: {path}")
+    return path
+
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL("user32")
+    _kernel32 = ctypes.WinDLL("kernel32")
+
+    # typed prototypes bound once so each call skips ctypes argument guessing
+    _GetForegroundWindow = _user32.GetForegroundWindow
+    _GetForegroundWindow.argtypes = []
+    _GetForegroundWindow.restype = wintypes.HWND
+
+    _GetWindowThreadProcessId = _user32.GetWindowThreadProcessId
+    _GetWindowThreadProcessId.argtypes = [wintypes.HWND, wintypes.LPDWORD]
+    _GetWindowThreadProcessId.restype = wintypes.DWORD
+
+    _AttachThreadInput = _user32.AttachThreadInput
+    _AttachThreadInput.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.BOOL]
+    _AttachThreadInput.restype = wintypes.BOOL
+
+    _SetForegroundWindow = _user32.SetForegroundWindow
+    _SetForegroundWindow.argtypes = [wintypes.HWND]
+    _SetForegroundWindow.restype = wintypes.BOOL
+
+    _BringWindowToTop = _user32.BringWindowToTop
+    _BringWindowToTop.argtypes = [wintypes.HWND]
+    _BringWindowToTop.restype = wintypes.BOOL
+
+    _GetCurrentThreadId = _kernel32.GetCurrentThreadId
+    _GetCurrentThreadId.argtypes = []
+    _GetCurrentThreadId.restype = wintypes.DWORD
+
+
 def force_foreground_window(hwnd: int):
-    user32 = ctypes.windll.user32
-    kernel32 = ctypes.windll.kernel32
-    foreground_hwnd = user32.GetForegroundWindow()
-    foreground_thread = user32.GetWindowThreadProcessId(foreground_hwnd, None)
-    current_thread = kernel32.GetCurrentThreadId()
+    foreground_hwnd = _GetForegroundWindow()
+    foreground_thread = _GetWindowThreadProcessId(foreground_hwnd, None)
+    current_thread = _GetCurrentThreadId()
     if foreground_thread != current_thread:
-        user32.AttachThreadInput(current_thread, foreground_thread, True)
-    user32.SetForegroundWindow(hwnd)
-    user32.BringWindowToTop(hwnd)
+        _AttachThreadInput(current_thread, foreground_thread, True)
+    _SetForegroundWindow(hwnd)
+    _BringWindowToTop(hwnd)
     if foreground_thread != current_thread:
-        user32.AttachThreadInput(current_thread, foreground_thread, False)
+        _AttachThreadInput(current_thread, foreground_thread, False)
@@ -0,0 +1,48 @@
+import sys
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from components import _format_display_column
+
+
+class FormatDisplayColumnTest(unittest.TestCase):
+    def assert_matches_str(self, column: pd.Series):
+        expected = [str(column.iat[idx]) for idx in range(len(column))]
+        self.assertEqual(list(_format_display_column(column)), expected)
+
+    def test_arrow_timestamp_matches_str(self):
+        timestamps = pa.array(
+            [pd.Timestamp("2020-01-01"), None, pd.Timestamp("2021-06-15 12:30:45")],
+            type=pa.timestamp("ns"),
+        )
+        column = pd.Series(timestamps.to_pandas(types_mapper=pd.ArrowDtype))
+        self.assert_matches_str(column)
+        self.assertEqual(_format_display_column(column)[0], "2020-01-01 00:00:00")
+
+    def test_arrow_date_matches_str(self):
+        dates = pa.array([0, None, 18000], type=pa.date32())
+        self.assert_matches_str(pd.Series(dates.to_pandas(types_mapper=pd.ArrowDtype)))
+
+    def test_nullable_dtypes_match_str(self):
+        for values, dtype in (
+            ([1, None, -3], "Int64"),
+            ([0.1, None, 1e20], "Float64"),
+            ([True, None, False], "boolean"),
+            (["a", None, "ü"], "string"),
+        ):
+            with self.subTest(dtype=dtype):
+                self.assert_matches_str(pd.Series(values, dtype=dtype))
+
+    def test_numpy_dtypes_match_str(self):
+        self.assert_matches_str(pd.Series([1, 2, 3]))
+        self.assert_matches_str(pd.Series([0.5, float("nan")]))
+        self.assert_matches_str(pd.Series(["x", None]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PyQt5.QtWidgets import QApplication
+
+from app import ParquetSQLApp
+from schemas import settings
+
+
+class QuitFlushesHistoryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        tmp_path = Path(self.tmp_dir.name)
+        self.history_file = tmp_path / "history.json"
+        self.data_file = tmp_path / "data.parquet"
+        pd.DataFrame({"a": [1, 2, 3]}).to_parquet(self.data_file)
+        patcher = mock.patch.object(settings, "usr_history_file", self.history_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_quit_saves_pending_history_of_other_windows(self):
+        first = ParquetSQLApp(None, enable_tray=False, launch_minimized=False)
+        second = ParquetSQLApp(None, enable_tray=False, launch_minimized=False)
+        # keep the temp file out of the user's recents list
+        second.data_container.open_file_path(self.data_file, add_to_recents=False)
+        second.sql_edit_controller.sql_edit.setPlainText("SELECT a FROM data")
+        second.sql_edit_controller.execute_query()
+        self.assertFalse(self.history_file.exists())
+
+        with mock.patch.object(QApplication, "quit"):
+            first._quit_application()
+        self.assertTrue(self.history_file.exists())
+        saved = json.loads(self.history_file.read_text(encoding="utf-8"))
+        self.assertIn("SELECT a FROM data", saved["queries"][str(self.data_file)])
+
+        for window in (first, second):
+            window._force_close = True
+            window.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
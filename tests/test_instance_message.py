@@ -0,0 +1,33 @@
+import json
+import os
+import sys
+import unittest
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app import INSTANCE_MESSAGE_KEY, _parse_instance_message
+
+
+def _legacy_message(path: str) -> bytes:
+    return json.dumps({INSTANCE_MESSAGE_KEY: path}).encode("utf-8")
+
+
+class ParseInstanceMessageTest(unittest.TestCase):
+    def test_windows_path(self):
+        path = "C:\\Users\\me\\data\\file.parquet"
+        self.assertEqual(_parse_instance_message(_legacy_message(path)), path)
+
+    def test_non_ascii_path(self):
+        path = "/home/me/資料/ü.parquet"
+        self.assertEqual(_parse_instance_message(_legacy_message(path)), path)
+
+    def test_invalid_payloads(self):
+        for payload in (b"", b"not json", b"[1, 2]", b'{"file": 3}', b'{"file": " "}'):
+            with self.subTest(payload=payload):
+                self.assertIsNone(_parse_instance_message(payload))
+
+
+if __name__ == "__main__":
+    unittest.main()